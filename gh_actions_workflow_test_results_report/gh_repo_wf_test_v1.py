@@ -11,25 +11,69 @@ Usage:
   python github_workflow_logs.py --file <repos_file_path>
 
   At least one of the above parameter combinations must be provided.
+  Use --workers <n> to change how many repositories are processed concurrently (default 8).
+  Use --engine rust to write the report with rustpy-xlsxwriter instead of xlsxwriter.
+  Use --format parquet or --format feather to write the results without Excel styling.
 
 Environment variables:
   GITHUB_TOKEN - GitHub Personal Access Token with appropriate permissions
 
 Output:
-  An Excel report containing the workflow test results
+  An Excel report containing the workflow test results (or a Parquet/Feather file with --format)
 """
 
 import os
 import sys
-import re
 import json
+import math
+import time
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime
-import pandas as pd
+from urllib.parse import urlencode
+
+# Prefer orjson for parsing API responses and reading/writing the caches when it is installed
+try:
+    from orjson import loads as json_loads, dumps as json_dumps
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        return json.dumps(obj).encode()
+
+# Prefer google-re2's linear-time engine for scanning large logs when it is installed
+try:
+    import re2 as re
+except ImportError:
+    import re
+
+# Rust-backed writer for --engine rust, used only when it is installed
+try:
+    from rustpy_xlsxwriter import write_worksheet, Format as RustFormat
+except ImportError:
+    write_worksheet = None
 
 # Constants
 GITHUB_API_URL = "https://api.github.com"
+MAX_WORKERS = 8  # Default number of repositories processed concurrently
+MAX_RUNS_CHECKED = 5  # Latest run plus previous runs checked for usable test data
+JOB_PAGE_WORKERS = 8  # Maximum number of job pages of one run fetched concurrently
+
+# Workflow files that had to be resolved to a numeric ID, persisted between runs
+WORKFLOW_ID_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "gh_wf_resolver.json")
+WORKFLOW_ID_CACHE_TTL = 24 * 60 * 60  # seconds
+workflow_id_cache = {}
+
+# ETag and parsed body per request, persisted between runs so repeated requests
+# can be answered with 304 Not Modified
+ETAG_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "gh_wf_etags.json")
+ETAG_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+etag_cache = {}
 WORKFLOWS = {
     "core-checkov-action.yml": {
         "job_name": "checkov-action",
@@ -48,6 +92,79 @@ WORKFLOWS = {
     }
 }
 
+HTTP_POOL_SIZE = 32  # Minimum number of keep-alive connections kept open to the API
+
+def create_https_adapter(pool_size):
+    """Return an HTTPS adapter that retries failed GETs and keeps pool_size connections alive."""
+    return HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False
+        )
+    )
+
+# Shared HTTP session so API calls reuse keep-alive connections across threads,
+# asking for gzip so JSON responses cross the network compressed
+SESSION = requests.Session()
+SESSION.headers["Accept-Encoding"] = "gzip"
+SESSION.mount("https://", create_https_adapter(HTTP_POOL_SIZE))
+
+# Precompiled log parsing patterns (inline flags only, so they compile under both re and re2)
+CHECKOV_EXACT_RE = re.compile(r"terraform scan results:\s*\n\s*Passed checks: (\d+), Failed checks: (\d+), Skipped checks: (\d+)")
+CHECKOV_GENERAL_RE = re.compile(r"Passed checks: (\d+), Failed checks: (\d+), Skipped checks: (\d+)")
+CHECKOV_ALT_RE = re.compile(r"PASSED: (\d+)\s+FAILED: (\d+)\s+SKIPPED: (\d+)")
+# Formats are tried in this order, so an earlier format wins wherever it appears in the log
+CHECKOV_PATTERNS = (CHECKOV_EXACT_RE, CHECKOV_GENERAL_RE, CHECKOV_ALT_RE)
+
+TF_PATTERNS = (
+    re.compile(r"(?i)Success!\s*(\d+)\s+passed,\s*(\d+)\s+failed"),
+    re.compile(r"(?i)(\d+)\s+passing,\s*(\d+)\s+failing"),
+    re.compile(r"(?i)Tests:\s*(\d+)\s+passed,\s*(\d+)\s+failed"),
+    re.compile(r"(?i)(\d+)\s+tests\s+passed\s*\((\d+)\s+failed\)"),
+)
+TF_PASSED_RE = re.compile(r"(?i)(\d+)\s+passed")
+TF_FAILED_RE = re.compile(r"(?i)(\d+)\s+failed")
+TF_PASS_KEYWORD_RE = re.compile(r"[Pp]ass(?:ed|ing)[:=\s]+(\d+)")
+TF_FAIL_KEYWORD_RE = re.compile(r"[Ff]ail(?:ed|ing|ures)[:=\s]+(\d+)")
+
+INSPEC_PROFILE_RE = re.compile(r"(?i)Profile Summary:\s*(\d+)\s+successful\s+Control,\s*(\d+)\s+failures?,\s*(\d+)\s+controls\s+skipped")
+INSPEC_TEST_RE = re.compile(r"(?i)Test Summary:\s*(\d+)\s+successful,\s*(\d+)\s+failures?,\s*(\d+)\s+skipped")
+INSPEC_SUCCESSFUL_RE = re.compile(r"(\d+)\s+successful")
+INSPEC_FAILURES_RE = re.compile(r"(\d+)\s+failures?")
+INSPEC_SKIPPED_RE = re.compile(r"(\d+)\s+skipped")
+
+# Case-insensitive keyword checks used to skip parsing logs without a summary,
+# without making lowercased copies of the log
+TF_PASS_PREFILTER_RE = re.compile(r"(?i)pass")
+TF_FAIL_PREFILTER_RE = re.compile(r"(?i)fail")
+INSPEC_SUMMARY_PREFILTER_RE = re.compile(r"(?i)summary")
+
+# Keywords used to pick out relevant lines when a log cannot be parsed
+TF_DEBUG_KEYWORDS_RE = re.compile(r"(?i)test|pass|fail|success")
+INSPEC_DEBUG_KEYWORDS_RE = re.compile(r"(?i)profile summary|test summary|successful|failures|skipped")
+
+# Summary lines are printed at the end of a job, so search this many trailing characters first
+LOG_TAIL_CHARS = 65536
+
+# Job logs are streamed and only the last LOG_TAIL_CHUNKS chunks (~2 MiB) are kept
+LOG_CHUNK_SIZE = 65536
+LOG_TAIL_CHUNKS = 32
+
+# Report background colors, shared by both Excel engines. Always the full 6-digit RGB form:
+# shorthand or alpha-prefixed values are read differently by other spreadsheet libraries
+HEADER_BG = '#D8E4BC'
+SUCCESS_BG = '#C6EFCE'
+FAIL_BG = '#FFC7CE'
+SKIP_BG = '#FFEB9C'
+
+# Rule printed above and below each repository in the console summary
+SEPARATOR = "=" * 80
+
 def get_github_token():
     """Get GitHub token from environment variable."""
     token = os.environ.get("GITHUB_TOKEN")
@@ -64,31 +181,82 @@ def get_headers(token):
     }
 
 def load_repositories_from_file(file_path):
-    """Load repository list from the given file."""
+    """Yield repositories from the given file, one line at a time."""
     try:
         with open(file_path, 'r') as file:
-            repos = []
             for line in file:
                 line = line.strip()
                 if not line:
                     continue
                 if '/' in line:
-                    repos.append(line)
+                    yield line
                 else:
                     print(f"Warning: Invalid repository format in line: {line}. Expected format: 'org/repo'")
-            return repos
     except FileNotFoundError:
         print(f"Error: Repository list file '{file_path}' not found.")
         sys.exit(1)
 
-def get_workflow_runs(repo, workflow_id, headers, per_page=6):
+def get_json_with_etag(url, headers, params=None):
+    """GET a JSON endpoint using a conditional request when a cached ETag is available.
+    Returns the response and the parsed body, or None as the body if the request failed.
+    The body is shared with the cache and saved for later runs, so callers must not mutate it.
+    """
+    cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+    cached = etag_cache.get(cache_key)
+    if cached:
+        headers = {**headers, "If-None-Match": cached["etag"]}
+    
+    response = SESSION.get(url, headers=headers, params=params)
+    
+    # Not modified responses have no body and do not count against the rate limit
+    if response.status_code == 304 and cached:
+        cached["cached_at"] = time.time()
+        return response, cached["data"]
+    if response.status_code != 200:
+        return response, None
+    
+    data = json_loads(response.content)
+    etag = response.headers.get("ETag")
+    if etag:
+        etag_cache[cache_key] = {"etag": etag, "data": data, "cached_at": time.time()}
+    return response, data
+
+def load_json_cache(path, ttl, stamp_key, target):
+    """Load cache entries from a JSON file into target, skipping entries older than ttl seconds."""
+    try:
+        with open(path, 'rb') as file:
+            cached_entries = json_loads(file.read())
+    except (OSError, ValueError):
+        return
+    
+    now = time.time()
+    for cache_key, entry in cached_entries.items():
+        if now - entry.get(stamp_key, 0) < ttl:
+            target[cache_key] = entry
+
+def save_json_cache(path, cache, label):
+    """Persist a cache to a JSON file for later runs."""
+    if not cache:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(json_dumps(cache))
+    except OSError as e:
+        print(f"Warning: Unable to save {label}: {str(e)}")
+
+def get_workflow_runs(repo, workflow_id, headers, per_page=MAX_RUNS_CHECKED):
     """Get multiple workflow runs for the specified workflow.
-    Returns up to per_page (default 6) runs to allow checking previous runs if latest fails.
+    Returns up to per_page (default MAX_RUNS_CHECKED) runs to allow checking previous runs if latest fails.
     """
-    url = f"{GITHUB_API_URL}/repos/{repo}/actions/workflows/{workflow_id}/runs"
+    # Use a previously resolved numeric ID to skip the 404 and workflow list lookups
+    cache_key = f"{repo}:{workflow_id}"
+    cached = workflow_id_cache.get(cache_key)
+    run_workflow_id = cached["id"] if cached else workflow_id
+    url = f"{GITHUB_API_URL}/repos/{repo}/actions/workflows/{run_workflow_id}/runs"
     
     # Try first with exact workflow ID
-    response = requests.get(url, headers=headers, params={"per_page": per_page})
+    response, data = get_json_with_etag(url, headers, {"per_page": per_page})
     
     # If not found, try to list all workflows and find a match
     if response.status_code == 404:
@@ -96,10 +264,10 @@ def get_workflow_runs(repo, workflow_id, headers, per_page=6):
         
         # Get all workflows
         all_workflows_url = f"{GITHUB_API_URL}/repos/{repo}/actions/workflows"
-        all_response = requests.get(all_workflows_url, headers=headers)
+        all_response, all_data = get_json_with_etag(all_workflows_url, headers)
         
-        if all_response.status_code == 200:
-            all_workflows = all_response.json().get("workflows", [])
+        if all_data is not None:
+            all_workflows = all_data.get("workflows", [])
             matching_workflow = None
             
             # Look for exact or partial match
@@ -118,15 +286,15 @@ def get_workflow_runs(repo, workflow_id, headers, per_page=6):
             if matching_workflow:
                 # Try again with the workflow ID
                 wf_id = matching_workflow.get("id")
+                workflow_id_cache[cache_key] = {"id": wf_id, "resolved_at": time.time()}
                 url = f"{GITHUB_API_URL}/repos/{repo}/actions/workflows/{wf_id}/runs"
-                response = requests.get(url, headers=headers, params={"per_page": per_page})
+                response, data = get_json_with_etag(url, headers, {"per_page": per_page})
     
-    if response.status_code != 200:
+    if data is None:
         print(f"Error fetching workflow runs: {response.status_code}")
         print(response.text)
         return None
     
-    data = response.json()
     if data.get("total_count", 0) == 0:
         print(f"No runs found for workflow {workflow_id}")
         return None
@@ -134,77 +302,106 @@ def get_workflow_runs(repo, workflow_id, headers, per_page=6):
     # Return all runs found (up to per_page)
     return data["workflow_runs"]
 
+def get_job_details_page(url, headers, page, per_page):
+    """Get a single page of job details, or None if the request fails."""
+    params = {
+        "per_page": per_page,
+        "page": page
+    }
+    
+    # Jobs of completed runs never change, so repeat runs are answered with 304 Not Modified
+    response, data = get_json_with_etag(url, headers, params)
+    
+    if data is None:
+        print(f"Error fetching job details (page {page}): {response.status_code}")
+        print(response.text)
+    
+    return data
+
 def get_job_details(repo, run_id, headers):
     """Get job details for a specific workflow run."""
     url = f"{GITHUB_API_URL}/repos/{repo}/actions/runs/{run_id}/jobs"
-    
-    # GitHub API may paginate results, so we need to handle multiple pages
-    all_jobs = []
-    page = 1
     per_page = 100
     
-    while True:
-        params = {
-            "per_page": per_page,
-            "page": page
-        }
-        
-        response = requests.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            print(f"Error fetching job details (page {page}): {response.status_code}")
-            print(response.text)
-            break
-        
-        data = response.json()
-        jobs = data.get("jobs", [])
-        all_jobs.extend(jobs)
-        
-        # Check if we need to fetch more pages
-        if len(jobs) < per_page:
-            break
-            
-        page += 1
+    # The first page tells us how many jobs there are in total
+    data = get_job_details_page(url, headers, 1, per_page)
+    if data is None:
+        return []
+    
+    # Copy the first page's jobs; the parsed body is shared with the ETag cache
+    all_jobs = list(data.get("jobs", []))
+    total_pages = math.ceil(data.get("total_count", 0) / per_page)
+    
+    # Fetch any remaining pages concurrently
+    if total_pages > 1:
+        pages = range(2, total_pages + 1)
+        with ThreadPoolExecutor(max_workers=min(JOB_PAGE_WORKERS, len(pages))) as executor:
+            page_results = executor.map(lambda page: get_job_details_page(url, headers, page, per_page), pages)
+            for page_data in page_results:
+                if page_data is None:
+                    break
+                all_jobs.extend(page_data.get("jobs", []))
     
     print(f"Retrieved {len(all_jobs)} jobs for run ID {run_id}")
     return all_jobs
 
-def get_job_logs(repo, job_id, headers):
-    """Get logs for a specific job."""
+def get_job_logs(repo, job_id, headers, tail_only=True):
+    """Get logs for a specific job.
+    By default only the tail of the log is kept, as that is where the test summaries are printed.
+    Returns the log content and whether earlier parts of the log were dropped.
+    """
     url = f"{GITHUB_API_URL}/repos/{repo}/actions/jobs/{job_id}/logs"
-    response = requests.get(url, headers=headers)
     
-    if response.status_code != 200:
-        print(f"Error fetching job logs: {response.status_code}")
-        return None
+    with SESSION.get(url, headers=headers, stream=True) as response:
+        if response.status_code != 200:
+            print(f"Error fetching job logs: {response.status_code}")
+            return None, False
+        
+        chunks = deque(maxlen=LOG_TAIL_CHUNKS if tail_only else None)
+        chunk_count = 0
+        for chunk in response.iter_content(chunk_size=LOG_CHUNK_SIZE):
+            chunks.append(chunk)
+            chunk_count += 1
     
-    log_content = response.text
+    truncated = chunk_count > len(chunks)
+    log_content = b"".join(chunks).decode("utf-8", errors="replace")
     
     # Simple validation check
     if not log_content or len(log_content.strip()) < 10:
         print(f"Warning: Retrieved log content is empty or too short for job ID {job_id}")
     
-    print(f"Successfully retrieved logs for job {job_id} - {len(log_content)} characters")
-    return log_content
+    if truncated:
+        print(f"Successfully retrieved logs for job {job_id} - last {len(log_content)} characters")
+    else:
+        print(f"Successfully retrieved logs for job {job_id} - {len(log_content)} characters")
+    return log_content, truncated
+
+def search_log_tail(pattern, logs):
+    """Search the tail of the logs for a pattern, falling back to the full logs."""
+    if len(logs) > LOG_TAIL_CHARS:
+        match = pattern.search(logs, len(logs) - LOG_TAIL_CHARS)
+        if match:
+            return match
+    return pattern.search(logs)
+
+def search_log_patterns(patterns, logs):
+    """Return the match of the first pattern, in priority order, found in the logs."""
+    for pattern in patterns:
+        match = search_log_tail(pattern, logs)
+        if match:
+            return match
+    return None
 
 def parse_checkov_logs(logs):
     """Parse Checkov logs to extract test counts."""
     if not logs:
         return {"status": "Not Run", "passed": 0, "failed": 0, "skipped": 0}
     
-    # First try the exact pattern mentioned in requirements
-    pattern = r"terraform scan results:\s*\n\s*Passed checks: (\d+), Failed checks: (\d+), Skipped checks: (\d+)"
-    match = re.search(pattern, logs)
-    
-    # If not found, try a more general pattern
-    if not match:
-        pattern = r"Passed checks: (\d+), Failed checks: (\d+), Skipped checks: (\d+)"
-        match = re.search(pattern, logs)
-    
-    # If still not found, try another common format
-    if not match:
-        pattern = r"PASSED: (\d+)\s+FAILED: (\d+)\s+SKIPPED: (\d+)"
-        match = re.search(pattern, logs)
+    # Try the exact pattern mentioned in requirements first, then more general formats.
+    # Skip the regex scans entirely when no summary marker is present in the logs.
+    match = None
+    if "checks:" in logs or "PASSED:" in logs:
+        match = search_log_patterns(CHECKOV_PATTERNS, logs)
         
     if match:
         return {
@@ -229,29 +426,19 @@ def parse_terraform_logs(logs):
     # Print first few characters for debugging
     print(f"Parsing Terraform logs (first 100 chars): {logs[:100]}...")
     
-    # First try the exact pattern mentioned in requirements (case insensitive)
-    pattern = r"Success!\s*(\d+)\s+passed,\s*(\d+)\s+failed"
-    match = re.search(pattern, logs, re.IGNORECASE)
+    # Every supported format reports both a pass and a fail count, so skip the
+    # regex scans when either keyword is missing
+    if not TF_PASS_PREFILTER_RE.search(logs) or not TF_FAIL_PREFILTER_RE.search(logs):
+        print_terraform_parse_failure(logs)
+        return {"status": "Log parsing failed", "passed": 0, "failed": 0}
     
-    # If not found, try alternative formats
-    if not match:
-        pattern = r"(\d+)\s+passing,\s*(\d+)\s+failing"
-        match = re.search(pattern, logs, re.IGNORECASE)
-    
-    # Try another common format
-    if not match:
-        pattern = r"Tests:\s*(\d+)\s+passed,\s*(\d+)\s+failed"
-        match = re.search(pattern, logs, re.IGNORECASE)
-    
-    # Try format with parentheses
-    if not match:
-        pattern = r"(\d+)\s+tests\s+passed\s*\((\d+)\s+failed\)"
-        match = re.search(pattern, logs, re.IGNORECASE)
+    # Try the exact pattern mentioned in requirements first, then alternative formats
+    match = search_log_patterns(TF_PATTERNS, logs)
     
     # Try plain "passed/failed" format
     if not match:
-        passed_match = re.search(r"(\d+)\s+passed", logs, re.IGNORECASE)
-        failed_match = re.search(r"(\d+)\s+failed", logs, re.IGNORECASE)
+        passed_match = search_log_tail(TF_PASSED_RE, logs)
+        failed_match = search_log_tail(TF_FAILED_RE, logs)
         if passed_match and failed_match:
             return {
                 "status": "Success" if int(failed_match.group(1)) == 0 else "Failed",
@@ -261,8 +448,8 @@ def parse_terraform_logs(logs):
     
     # Try extracting numbers after specific keywords
     if not match:
-        all_pass_matches = re.findall(r"[Pp]ass(?:ed|ing)[:=\s]+(\d+)", logs)
-        all_fail_matches = re.findall(r"[Ff]ail(?:ed|ing|ures)[:=\s]+(\d+)", logs)
+        all_pass_matches = TF_PASS_KEYWORD_RE.findall(logs)
+        all_fail_matches = TF_FAIL_KEYWORD_RE.findall(logs)
         
         if all_pass_matches and all_fail_matches:
             # Use the largest numbers found as they're likely the summary
@@ -289,36 +476,36 @@ def parse_terraform_logs(logs):
             break
     
     if exact_format_line:
-        nums = re.findall(r'\d+', exact_format_line)
+        # Plain string splitting is enough for the fixed "Success! N passed, M failed" layout
+        nums = [int(part) for part in exact_format_line.replace(",", " ").split() if part.isdecimal()]
         if len(nums) >= 2:
             return {
-                "status": "Success" if int(nums[1]) == 0 else "Failed",
-                "passed": int(nums[0]),
-                "failed": int(nums[1])
+                "status": "Success" if nums[1] == 0 else "Failed",
+                "passed": nums[0],
+                "failed": nums[1]
             }
     
     # Log sections of the logs for debugging
-    if logs:
-        print("Warning: Unable to parse Terraform logs. Here's a sample:")
-        print("First 200 chars:")
-        print(logs[:200])
-        print("\nLast 200 chars:")
-        print(logs[-200:])
-        
-        # Extract lines containing keywords that might help diagnosis
-        keywords = ["test", "pass", "fail", "success"]
-        relevant_lines = []
-        for line in logs.splitlines():
-            if any(keyword in line.lower() for keyword in keywords):
-                relevant_lines.append(line)
-        
-        if relevant_lines:
-            print("\nRelevant lines containing test-related keywords:")
-            for line in relevant_lines[:10]:  # Print first 10 relevant lines
-                print(f"  {line}")
+    print_terraform_parse_failure(logs)
     
     return {"status": "Log parsing failed", "passed": 0, "failed": 0}
 
+def print_terraform_parse_failure(logs):
+    """Print a sample of Terraform logs that could not be parsed."""
+    print("Warning: Unable to parse Terraform logs. Here's a sample:")
+    print("First 200 chars:")
+    print(logs[:200])
+    print("\nLast 200 chars:")
+    print(logs[-200:])
+    
+    # Extract lines containing keywords that might help diagnosis
+    relevant_lines = [line for line in logs.splitlines() if TF_DEBUG_KEYWORDS_RE.search(line)]
+    
+    if relevant_lines:
+        print("\nRelevant lines containing test-related keywords:")
+        for line in relevant_lines[:10]:  # Print first 10 relevant lines
+            print(f"  {line}")
+
 def parse_inspec_logs(logs):
     """
     Parse Chef Inspec logs to extract test counts.
@@ -331,13 +518,15 @@ def parse_inspec_logs(logs):
     
     print(f"Parsing InSpec logs (first 100 chars): {logs[:100]}...")
     
+    # All supported formats live in a summary block, so skip the scans when there is none
+    if not INSPEC_SUMMARY_PREFILTER_RE.search(logs):
+        print_inspec_parse_failure(logs.splitlines())
+        return {"status": "Log parsing failed", "passed": 0, "failed": 0, "skipped": 0}
+    
     # Look for both Profile Summary and Test Summary patterns
     # We'll prioritize Test Summary as it contains the detailed test counts
-    profile_pattern = r"Profile Summary:\s*(\d+)\s+successful\s+Control,\s*(\d+)\s+failures?,\s*(\d+)\s+controls\s+skipped"
-    test_pattern = r"Test Summary:\s*(\d+)\s+successful,\s*(\d+)\s+failures?,\s*(\d+)\s+skipped"
-    
-    profile_match = re.search(profile_pattern, logs, re.IGNORECASE)
-    test_match = re.search(test_pattern, logs, re.IGNORECASE)
+    profile_match = search_log_tail(INSPEC_PROFILE_RE, logs)
+    test_match = search_log_tail(INSPEC_TEST_RE, logs)
     
     # Debug information
     if profile_match:
@@ -361,9 +550,12 @@ def parse_inspec_logs(logs):
             "skipped": int(profile_match.group(3))
         }
     
+    # Split once; the remaining line-based fallbacks all reuse this list
+    lines = logs.splitlines()
+    
     # If the specific patterns above didn't match, search for lines containing both patterns
     inspec_lines = []
-    for line in logs.splitlines():
+    for line in lines:
         if "Profile Summary:" in line or "Test Summary:" in line:
             inspec_lines.append(line.strip())
     
@@ -376,7 +568,7 @@ def parse_inspec_logs(logs):
         
         for line in inspec_lines:
             # Try Profile Summary pattern
-            match = re.search(r"Profile Summary:\s*(\d+)\s+successful\s+Control,\s*(\d+)\s+failures?,\s*(\d+)\s+controls\s+skipped", line)
+            match = INSPEC_PROFILE_RE.search(line)
             if match:
                 profile_data = {
                     "status": "Success" if int(match.group(2)) == 0 else "Failed",
@@ -386,7 +578,7 @@ def parse_inspec_logs(logs):
                 }
             
             # Try Test Summary pattern
-            match = re.search(r"Test Summary:\s*(\d+)\s+successful,\s*(\d+)\s+failures?,\s*(\d+)\s+skipped", line)
+            match = INSPEC_TEST_RE.search(line)
             if match:
                 test_data = {
                     "status": "Success" if int(match.group(2)) == 0 else "Failed",
@@ -403,12 +595,12 @@ def parse_inspec_logs(logs):
             print(f"Using profile data: {profile_data}")
             return profile_data
     
-    # If still no match found, extract sections of the log containing "summary" for further analysis
-    summary_sections = []
+    # If still no match found, check each section of the log containing "summary" as soon
+    # as it ends, stopping at the first one that yields all three counts
     in_summary_section = False
     summary_lines = []
     
-    for line in logs.splitlines():
+    for line in lines:
         # Start of a summary section
         if "Summary" in line:
             in_summary_section = True
@@ -419,54 +611,65 @@ def parse_inspec_logs(logs):
                 summary_lines.append(line)
             else:  # Empty line might end the section
                 if summary_lines:
-                    summary_sections.append("\n".join(summary_lines))
+                    section_data = parse_inspec_summary_section("\n".join(summary_lines))
+                    if section_data:
+                        return section_data
                 in_summary_section = False
                 summary_lines = []
     
-    # Add the last section if there's one in progress
+    # Check the last section if there's one in progress
     if summary_lines:
-        summary_sections.append("\n".join(summary_lines))
-    
-    if summary_sections:
-        print(f"Found {len(summary_sections)} summary sections")
-        for section in summary_sections:
-            # Look for numbers followed by relevant keywords
-            successful_match = re.search(r"(\d+)\s+successful", section)
-            failures_match = re.search(r"(\d+)\s+failures?", section)
-            skipped_match = re.search(r"(\d+)\s+skipped", section)
-            
-            if successful_match and failures_match and skipped_match:
-                return {
-                    "status": "Success" if int(failures_match.group(1)) == 0 else "Failed",
-                    "passed": int(successful_match.group(1)),
-                    "failed": int(failures_match.group(1)),
-                    "skipped": int(skipped_match.group(1))
-                }
+        section_data = parse_inspec_summary_section("\n".join(summary_lines))
+        if section_data:
+            return section_data
     
     # Last resort: print parts of the log for debugging and return a failure status
-    if logs:
-        print("Warning: Unable to parse Inspec logs. Here's relevant sections:")
-        
-        # Extract chunks with keywords for debugging
-        keywords = ["profile summary", "test summary", "successful", "failures", "skipped"]
-        lines_with_keywords = []
-        
-        for i, line in enumerate(logs.splitlines()):
-            lower_line = line.lower()
-            if any(keyword in lower_line for keyword in keywords):
-                # Get context (3 lines before and after)
-                start = max(0, i - 3)
-                end = min(len(logs.splitlines()), i + 4)
-                context = logs.splitlines()[start:end]
-                lines_with_keywords.append(f"--- Context around line {i+1} ---")
-                lines_with_keywords.extend(context)
-                lines_with_keywords.append("")
-        
-        if lines_with_keywords:
-            print("\n".join(lines_with_keywords[:20]))  # Print up to 20 lines
+    print_inspec_parse_failure(lines)
     
     return {"status": "Log parsing failed", "passed": 0, "failed": 0, "skipped": 0}
 
+def parse_inspec_summary_section(section):
+    """Extract test counts from a free-form InSpec summary section, or None if incomplete."""
+    # Look for numbers followed by relevant keywords
+    successful_match = INSPEC_SUCCESSFUL_RE.search(section)
+    failures_match = INSPEC_FAILURES_RE.search(section)
+    skipped_match = INSPEC_SKIPPED_RE.search(section)
+    
+    if successful_match and failures_match and skipped_match:
+        return {
+            "status": "Success" if int(failures_match.group(1)) == 0 else "Failed",
+            "passed": int(successful_match.group(1)),
+            "failed": int(failures_match.group(1)),
+            "skipped": int(skipped_match.group(1))
+        }
+    return None
+
+def print_inspec_parse_failure(lines):
+    """Print the sections of InSpec log lines that could not be parsed."""
+    print("Warning: Unable to parse Inspec logs. Here's relevant sections:")
+    
+    # Extract chunks with keywords for debugging
+    lines_with_keywords = []
+    
+    for i, line in enumerate(lines):
+        if INSPEC_DEBUG_KEYWORDS_RE.search(line):
+            # Get context (3 lines before and after)
+            start = max(0, i - 3)
+            end = min(len(lines), i + 4)
+            context = lines[start:end]
+            lines_with_keywords.append(f"--- Context around line {i+1} ---")
+            lines_with_keywords.extend(context)
+            lines_with_keywords.append("")
+            if len(lines_with_keywords) >= 20:
+                break
+    
+    if lines_with_keywords:
+        print("\n".join(lines_with_keywords[:20]))  # Print up to 20 lines
+
+# Resolve parser names to functions once, now that the parsers are defined
+for workflow_config in WORKFLOWS.values():
+    workflow_config["parser"] = globals()[workflow_config["parser"]]
+
 def process_workflow_run(repo, workflow_id, run, headers, config):
     """Process a single workflow run and attempt to extract test results."""
     run_id = run["id"]
@@ -536,7 +739,7 @@ def process_workflow_run(repo, workflow_id, run, headers, config):
     
     # Get and parse the logs
     print(f"Fetching logs for workflow in {repo} (Run ID: {run_id}, Job ID: {job_id})")
-    logs = get_job_logs(repo, job_id, headers)
+    logs, truncated = get_job_logs(repo, job_id, headers)
     
     if not logs:
         print(f"No logs retrieved for job ID: {job_id}")
@@ -548,11 +751,19 @@ def process_workflow_run(repo, workflow_id, run, headers, config):
             "results": {"status": "No logs", "passed": 0, "failed": 0, "skipped": 0}
         }
     
-    print(f"Parsing logs using {config['parser']} function")
-    parser_func = globals()[config["parser"]]
+    parser_func = config["parser"]
+    print(f"Parsing logs using {parser_func.__name__} function")
     
     # Parse logs and extract test counts
     test_results = parser_func(logs)
+    
+    # The summary may have been printed before the retained tail, so retry with the full log
+    if truncated and test_results["status"] == "Log parsing failed":
+        print(f"No test summary in the log tail for job ID: {job_id}. Fetching the full log.")
+        full_logs, _ = get_job_logs(repo, job_id, headers, tail_only=False)
+        if full_logs:
+            test_results = parser_func(full_logs)
+    
     print(f"Parsing results: {test_results}")
     
     # Check if the parse was successful (found actual data)
@@ -575,232 +786,272 @@ def process_workflow_run(repo, workflow_id, run, headers, config):
             "test_data_found": False
         }
 
-def get_workflow_results(repo, headers):
-    """Get results for all specified workflows in a repository."""
-    results = {}
+def get_single_workflow_result(repo, workflow_id, config, headers):
+    """Get results for one workflow in a repository."""
+    print(f"\nProcessing workflow: {workflow_id} for repository: {repo}")
     
-    for workflow_id, config in WORKFLOWS.items():
-        print(f"\nProcessing workflow: {workflow_id} for repository: {repo}")
-        
-        # Get multiple workflow runs (up to 6 to allow for checking 5 previous runs)
-        workflow_runs = get_workflow_runs(repo, workflow_id, headers, per_page=6)
-        
-        if not workflow_runs:
-            print(f"No runs found for workflow: {workflow_id}")
-            results[workflow_id] = {
-                "run_id": None,
-                "run_date": None,
-                "status": "No runs found",
-                "job_id": None,
-                "results": {"status": "Not Run", "passed": 0, "failed": 0, "skipped": 0}
-            }
-            continue
+    # Get only as many workflow runs as will be checked, in a single request
+    workflow_runs = get_workflow_runs(repo, workflow_id, headers, per_page=MAX_RUNS_CHECKED)
+    
+    if not workflow_runs:
+        print(f"No runs found for workflow: {workflow_id}")
+        return {
+            "run_id": None,
+            "run_date": None,
+            "status": "No runs found",
+            "job_id": None,
+            "results": {"status": "Not Run", "passed": 0, "failed": 0, "skipped": 0}
+        }
 
-        # Process each run until we find one with usable test data or exhaust all options
-        test_data_found = False
-        runs_checked = 0
-        run_results = None
-        
-        for run in workflow_runs:
-            runs_checked += 1
-            if runs_checked > 5:  # Only check up to 5 runs
-                break
-                
-            run_results = process_workflow_run(repo, workflow_id, run, headers, config)
-            
-            # Check if we found usable test data
-            if "test_data_found" in run_results and run_results["test_data_found"]:
-                test_data_found = True
-                # Remove the temporary flag before storing the result
-                del run_results["test_data_found"]
-                print(f"Found usable test data in run {runs_checked}")
-                break
+    # Process each run until we find one with usable test data or exhaust all options
+    test_data_found = False
+    runs_checked = 0
+    run_results = None
+    
+    for run in workflow_runs:
+        runs_checked += 1
+        if runs_checked > MAX_RUNS_CHECKED:
+            break
             
-            print(f"No usable test data found in run {runs_checked}. Trying next run if available.")
+        run_results = process_workflow_run(repo, workflow_id, run, headers, config)
         
-        # If we've exhausted all options and still haven't found test data
-        if not test_data_found:
-            print(f"Could not find usable test data in the last {runs_checked} runs")
-            if run_results:
-                # Remove the temporary flag if it exists
-                if "test_data_found" in run_results:
-                    del run_results["test_data_found"]
-                    
-                # Update the status to reflect this situation
-                run_results["results"]["status"] = f"Test_Not_Run_latest_{runs_checked}_workflows"
-                results[workflow_id] = run_results
-            else:
-                results[workflow_id] = {
-                    "run_id": None,
-                    "run_date": None,
-                    "status": f"Test_Not_Run_latest_{runs_checked}_workflows",
-                    "job_id": None,
-                    "results": {"status": f"Test_Not_Run_latest_{runs_checked}_workflows", "passed": 0, "failed": 0, "skipped": 0}
-                }
-        else:
-            results[workflow_id] = run_results
+        # Check if we found usable test data
+        if "test_data_found" in run_results and run_results["test_data_found"]:
+            test_data_found = True
+            # Remove the temporary flag before storing the result
+            del run_results["test_data_found"]
+            print(f"Found usable test data in run {runs_checked}")
+            break
+        
+        print(f"No usable test data found in run {runs_checked}. Trying next run if available.")
+    
+    # If we've exhausted all options and still haven't found test data
+    if not test_data_found:
+        print(f"Could not find usable test data in the last {runs_checked} runs")
+        if run_results:
+            # Remove the temporary flag if it exists
+            if "test_data_found" in run_results:
+                del run_results["test_data_found"]
+                
+            # Update the status to reflect this situation
+            run_results["results"]["status"] = f"Test_Not_Run_latest_{runs_checked}_workflows"
+            return run_results
+        return {
+            "run_id": None,
+            "run_date": None,
+            "status": f"Test_Not_Run_latest_{runs_checked}_workflows",
+            "job_id": None,
+            "results": {"status": f"Test_Not_Run_latest_{runs_checked}_workflows", "passed": 0, "failed": 0, "skipped": 0}
+        }
     
-    return results
+    return run_results
+
+def get_workflow_results(repo, headers):
+    """Get results for all specified workflows in a repository."""
+    # Workflows are independent, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(WORKFLOWS)) as executor:
+        futures = {
+            workflow_id: executor.submit(get_single_workflow_result, repo, workflow_id, config, headers)
+            for workflow_id, config in WORKFLOWS.items()
+        }
+        return {workflow_id: future.result() for workflow_id, future in futures.items()}
 
 def format_results(repo, results):
     """Format results for display."""
-    output = f"\n{'=' * 80}\n"
-    output += f"Repository: {repo}\n"
-    output += f"{'=' * 80}\n\n"
+    lines = [f"\n{SEPARATOR}", f"Repository: {repo}", SEPARATOR, ""]
     
     for workflow_id, data in results.items():
-        output += f"Workflow: {workflow_id}\n"
-        output += f"  Run Date: {data['run_date'] or 'N/A'}\n"
-        output += f"  Workflow Status: {data['status']}\n"
-        
         workflow_config = WORKFLOWS[workflow_id]
-        output += f"  Job Name: {workflow_config['job_name']}\n"
-        output += f"  Stage Name: {workflow_config['stage_name']}\n"
-        
         test_results = data['results']
-        output += f"  Test Results Status: {test_results['status']}\n"
+        lines += [
+            f"Workflow: {workflow_id}",
+            f"  Run Date: {data['run_date'] or 'N/A'}",
+            f"  Workflow Status: {data['status']}",
+            f"  Job Name: {workflow_config['job_name']}",
+            f"  Stage Name: {workflow_config['stage_name']}",
+            f"  Test Results Status: {test_results['status']}"
+        ]
         
         if "passed" in test_results:
-            output += f"  Passed: {test_results['passed']}\n"
+            lines.append(f"  Passed: {test_results['passed']}")
         if "failed" in test_results:
-            output += f"  Failed: {test_results['failed']}\n"
+            lines.append(f"  Failed: {test_results['failed']}")
         if "skipped" in test_results:
-            output += f"  Skipped: {test_results['skipped']}\n"
+            lines.append(f"  Skipped: {test_results['skipped']}")
         
-        output += "\n"
+        lines.append("")
     
-    return output
+    return "\n".join(lines) + "\n"
 
-def generate_excel_report(all_results, output_file=None):
-    """Generate an Excel report from all results."""
-    if output_file is None:
-        output_file = f"workflow_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    
-    # Create a Pandas ExcelWriter object
-    writer = pd.ExcelWriter(output_file, engine='xlsxwriter')
+def write_rust_report(df, output_file, column_widths):
+    """Write the report DataFrame with the Rust-backed rustpy-xlsxwriter."""
+    number_format = RustFormat().set_num_format('0')
+    date_format = RustFormat().set_num_format('yyyy-mm-dd hh:mm:ss')
+    success_format = RustFormat().set_background_color(SUCCESS_BG)
+    fail_format = RustFormat().set_background_color(FAIL_BG)
+    skip_format = RustFormat().set_background_color(SKIP_BG)
+    
+    # Per-column rules matching the xlsxwriter formulas: the status column is shaded by its
+    # text and the Passed/Failed columns when their count is above 0. Every status is a
+    # fixed string, so begins_with matches the same cells an equality check would
+    conditional_formats = {
+        "Test Status": [
+            {'type': 'text', 'criteria': 'begins_with', 'value': "Success", 'format': success_format},
+            {'type': 'text', 'criteria': 'begins_with', 'value': "Failed", 'format': fail_format},
+            {'type': 'text', 'criteria': 'begins_with', 'value': "Skipped", 'format': skip_format}
+        ],
+        "Passed": {'type': 'cell', 'criteria': '>', 'value': 0, 'format': success_format},
+        "Failed": {'type': 'cell', 'criteria': '>', 'value': 0, 'format': fail_format}
+    }
     
-    # Convert results to DataFrame format
-    data = []
+    # The Rust writer does not accept pandas NA values, so pass missing values as None
+    write_worksheet(
+        df.astype(object).where(df.notna(), None),
+        output_file,
+        sheet_name="Workflow Results",
+        autofit=False,
+        column_widths=column_widths,
+        column_formats={"Run ID": number_format, "Job ID": number_format, "Run Date": date_format,
+                        "Passed": number_format, "Failed": number_format, "Skipped": number_format},
+        header_format=RustFormat().set_bold().set_background_color(HEADER_BG).set_border('thin'),
+        conditional_formats=conditional_formats if not df.empty else None
+    )
+
+def write_xlsxwriter_report(df, output_file, column_widths):
+    """Write the report DataFrame with xlsxwriter."""
+    import pandas as pd
+    import xlsxwriter
+    from xlsxwriter.utility import xl_range, xl_rowcol_to_cell
+    
+    # Create the workbook directly, flushing each row to disk as it is written and
+    # skipping the URL detection xlsxwriter otherwise runs on every string
+    workbook = xlsxwriter.Workbook(output_file, {'constant_memory': True, 'strings_to_urls': False})
+    worksheet = workbook.add_worksheet("Workflow Results")
+    
+    # Create every format once up front and reuse it for all cells and rules
+    formats = {
+        'header': workbook.add_format({'bold': True, 'bg_color': HEADER_BG, 'border': 1}),
+        'number': workbook.add_format({'num_format': '0'}),
+        'date': workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'}),
+        'success': workbook.add_format({'bg_color': SUCCESS_BG}),
+        'fail': workbook.add_format({'bg_color': FAIL_BG}),
+        'skip': workbook.add_format({'bg_color': SKIP_BG})
+    }
     
-    for repo, workflows in all_results.items():
-        for workflow_id, workflow_data in workflows.items():
-            row = {
-                "Repository": repo,
-                "Workflow": workflow_id,
-                "Run ID": workflow_data.get("run_id"),
-                "Job ID": workflow_data.get("job_id"),
-                "Run Date": workflow_data.get("run_date"),
-                "Workflow Status": workflow_data.get("status"),
-                "Job Name": WORKFLOWS[workflow_id]["job_name"],
-                "Stage Name": WORKFLOWS[workflow_id]["stage_name"],
-                "Test Status": workflow_data["results"]["status"],
-                "Passed": workflow_data["results"].get("passed", 0),
-                "Failed": workflow_data["results"].get("failed", 0),
-                "Skipped": workflow_data["results"].get("skipped", 0) if "skipped" in workflow_data["results"] else 0
-            }
-            data.append(row)
-    
-    df = pd.DataFrame(data)
-    
-    # Write to the Excel file
-    df.to_excel(writer, sheet_name="Workflow Results", index=False)
-    
-    # Get workbook and worksheet objects
-    workbook = writer.book
-    worksheet = writer.sheets["Workflow Results"]
-    
-    # Add some formatting
-    header_format = workbook.add_format({
-        'bold': True,
-        'bg_color': '#D8E4BC',
-        'border': 1
-    })
-    
-    number_format = workbook.add_format({'num_format': '0'})
-    date_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
-    
-    # Apply formatting to header row
-    for col_num, value in enumerate(df.columns.values):
-        worksheet.write(0, col_num, value, header_format)
-    
-    # Apply number formatting to numeric columns
-    passed_col = df.columns.get_loc("Passed") + 1
-    failed_col = df.columns.get_loc("Failed") + 1
-    skipped_col = df.columns.get_loc("Skipped") + 1
-    run_id_col = df.columns.get_loc("Run ID") + 1
-    job_id_col = df.columns.get_loc("Job ID") + 1
-    date_col = df.columns.get_loc("Run Date") + 1
-    
-    for row_num in range(1, len(df) + 1):
-        worksheet.write_number(row_num, passed_col - 1, df.iloc[row_num-1]["Passed"], number_format)
-        worksheet.write_number(row_num, failed_col - 1, df.iloc[row_num-1]["Failed"], number_format)
-        worksheet.write_number(row_num, skipped_col - 1, df.iloc[row_num-1]["Skipped"], number_format)
+    # In constant memory mode rows must be written in order and column formats set up front
+    column_formats = {"Run ID": formats['number'], "Job ID": formats['number'], "Run Date": formats['date'],
+                      "Passed": formats['number'], "Failed": formats['number'], "Skipped": formats['number']}
+    for i, col in enumerate(df.columns):
+        worksheet.set_column(i, i, column_widths[i], column_formats.get(col))
+    
+    # Write the header row, then the data rows
+    worksheet.write_row(0, 0, df.columns, formats['header'])
+    for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        worksheet.write_row(row_num, 0, [None if pd.isna(value) else value for value in row])
+    
+    # Add conditional formatting for test status and test counts, skipped when there are no
+    # rows to format. Each format is a single formula rule spanning the Test Status column
+    # and its matching count column; the formula is relative to the first Test Status cell,
+    # so on the count column it checks the count instead (ISNUMBER keeps status text from
+    # comparing as greater than 0)
+    if not df.empty:
+        col_idx = {col: i for i, col in enumerate(df.columns)}
+        test_status_col = col_idx["Test Status"]
+        passed_col = col_idx["Passed"]
+        failed_col = col_idx["Failed"]
+        last_row = 1048575  # Last worksheet row, so each rule covers its whole column below the header
         
-        # Format IDs as numbers if they exist
-        if pd.notna(df.iloc[row_num-1]["Run ID"]):
-            worksheet.write_number(row_num, run_id_col - 1, df.iloc[row_num-1]["Run ID"], number_format)
-        if pd.notna(df.iloc[row_num-1]["Job ID"]):
-            worksheet.write_number(row_num, job_id_col - 1, df.iloc[row_num-1]["Job ID"], number_format)
+        status_range = xl_range(1, test_status_col, last_row, test_status_col)
+        passed_range = xl_range(1, passed_col, last_row, passed_col)
+        failed_range = xl_range(1, failed_col, last_row, failed_col)
+        status_cell = xl_rowcol_to_cell(1, test_status_col)
         
-        # Format date if it exists
-        if pd.notna(df.iloc[row_num-1]["Run Date"]):
-            try:
-                date_str = df.iloc[row_num-1]["Run Date"]
-                # Try to convert to datetime if it's a string
-                if isinstance(date_str, str):
-                    date_obj = datetime.strptime(date_str, "%Y-%m-%dT%H:%M:%SZ")
-                    worksheet.write_datetime(row_num, date_col - 1, date_obj, date_format)
-            except:
-                # If conversion fails, just write as is
-                worksheet.write(row_num, date_col - 1, df.iloc[row_num-1]["Run Date"])
-    
-    # Adjust columns width
-    for i, col in enumerate(df.columns):
-        max_len = max(df[col].astype(str).apply(len).max(), len(col)) + 2
-        worksheet.set_column(i, i, max_len)
-    
-    # Add conditional formatting for test status
-    success_format = workbook.add_format({'bg_color': '#C6EFCE'})
-    fail_format = workbook.add_format({'bg_color': '#FFC7CE'})
-    skip_format = workbook.add_format({'bg_color': '#FFEB9C'})
-    
-    test_status_col = df.columns.get_loc("Test Status") + 1  # +1 because Excel is 1-indexed
-    worksheet.conditional_format(1, test_status_col - 1, len(df) + 1, test_status_col - 1,
-                               {'type': 'cell',
-                                'criteria': 'equal to',
-                                'value': '"Success"',
-                                'format': success_format})
-    
-    worksheet.conditional_format(1, test_status_col - 1, len(df) + 1, test_status_col - 1,
-                               {'type': 'cell',
-                                'criteria': 'equal to',
-                                'value': '"Failed"',
-                                'format': fail_format})
-    
-    worksheet.conditional_format(1, test_status_col - 1, len(df) + 1, test_status_col - 1,
-                               {'type': 'cell',
-                                'criteria': 'equal to',
-                                'value': '"Skipped"',
-                                'format': skip_format})
-    
-    # Add conditional formatting for test counts
-    # Highlight non-zero values in Failed column
-    worksheet.conditional_format(1, failed_col - 1, len(df) + 1, failed_col - 1,
-                               {'type': 'cell',
-                                'criteria': 'greater than',
-                                'value': 0,
-                                'format': fail_format})
-    
-    # Highlight passed counts
-    worksheet.conditional_format(1, passed_col - 1, len(df) + 1, passed_col - 1,
-                                {'type': 'cell',
-                                 'criteria': 'greater than',
-                                 'value': 0,
-                                 'format': success_format})
+        worksheet.conditional_format(status_range, {
+            'type': 'formula',
+            'criteria': f'=OR({status_cell}="Success",AND(ISNUMBER({status_cell}),{status_cell}>0))',
+            'format': formats['success'],
+            'multi_range': f"{status_range} {passed_range}"
+        })
+        worksheet.conditional_format(status_range, {
+            'type': 'formula',
+            'criteria': f'=OR({status_cell}="Failed",AND(ISNUMBER({status_cell}),{status_cell}>0))',
+            'format': formats['fail'],
+            'multi_range': f"{status_range} {failed_range}"
+        })
+        worksheet.conditional_format(status_range, {
+            'type': 'formula',
+            'criteria': f'={status_cell}="Skipped"',
+            'format': formats['skip']
+        })
     
     # Write the Excel file
-    writer.close()
+    workbook.close()
+
+def generate_excel_report(all_results, output_file=None, engine="xlsxwriter", output_format="xlsx"):
+    """Generate an Excel report from all results, or a Parquet/Feather file when output_format asks for one."""
+    # Import pandas only once a report is written, so --help and argument errors stay fast
+    import pandas as pd
+    
+    if output_file is None:
+        output_file = f"workflow_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{output_format}"
+    
+    # Convert results to DataFrame format, one tuple per row in column order
+    columns = ["Repository", "Workflow", "Run ID", "Job ID", "Run Date", "Workflow Status",
+               "Job Name", "Stage Name", "Test Status", "Passed", "Failed", "Skipped"]
+    data = []
     
+    for repo, workflows in all_results.items():
+        for workflow_id, workflow_data in workflows.items():
+            workflow_config = WORKFLOWS[workflow_id]
+            results = workflow_data["results"]
+            data.append((
+                repo,
+                workflow_id,
+                workflow_data.get("run_id"),
+                workflow_data.get("job_id"),
+                workflow_data.get("run_date"),
+                workflow_data.get("status"),
+                workflow_config["job_name"],
+                workflow_config["stage_name"],
+                results["status"],
+                results.get("passed", 0),
+                results.get("failed", 0),
+                results.get("skipped", 0)
+            ))
+    
+    df = pd.DataFrame.from_records(data, columns=columns)
+    
+    # Size columns from the raw values, before dates are converted; an empty report is sized to its headers
+    column_widths = [max(df[col].astype(str).str.len().max() if not df.empty else 0, len(col)) + 2
+                     for col in df.columns]
+    
+    # Convert columns to their proper types so they are written as numbers and dates
+    df["Run Date"] = pd.to_datetime(df["Run Date"], format="%Y-%m-%dT%H:%M:%SZ", errors="coerce")
+    df[["Run ID", "Job ID"]] = df[["Run ID", "Job ID"]].astype("Int64")
+    df[["Passed", "Failed", "Skipped"]] = df[["Passed", "Failed", "Skipped"]].astype("int64")
+    
+    # Write to a temporary file next to the output and rename it into place once it is
+    # complete, so an interrupted run never leaves a truncated report behind
+    root, ext = os.path.splitext(output_file)
+    tmp_file = f"{root}.tmp{ext}"
+    
+    try:
+        # Columnar formats skip the worksheet styling entirely
+        if output_format == "parquet":
+            df.to_parquet(tmp_file, compression="zstd", index=False)
+        elif output_format == "feather":
+            df.to_feather(tmp_file)
+        elif engine == "rust":
+            write_rust_report(df, tmp_file, column_widths)
+        else:
+            write_xlsxwriter_report(df, tmp_file, column_widths)
+    except BaseException:
+        # Don't leave a partially written report behind
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+    
+    os.replace(tmp_file, output_file)
     return output_file
 
 def parse_args():
@@ -813,12 +1064,22 @@ def parse_args():
     
     parser.add_argument('--org', type=str, help='Organization name (required when using --repo)')
     parser.add_argument('--output', type=str, help='Output Excel file name (optional)')
+    parser.add_argument('--format', choices=['xlsx', 'parquet', 'feather'], default='xlsx',
+                        help='Report file format; parquet and feather require pyarrow (default: xlsx)')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help=f'Number of repositories to process concurrently (default: {MAX_WORKERS})')
+    parser.add_argument('--engine', choices=['xlsxwriter', 'rust'], default='xlsxwriter',
+                        help='Excel writer to use; rust requires rustpy-xlsxwriter (default: xlsxwriter)')
     
     args = parser.parse_args()
     
     # Validate args
     if args.repo and not args.org:
         parser.error("--org is required when using --repo")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.engine == 'rust' and write_worksheet is None:
+        parser.error("--engine rust requires the rustpy-xlsxwriter package")
     
     return args
 
@@ -829,30 +1090,56 @@ def main():
     headers = get_headers(token)
     all_results = {}
     
-    # Get repositories list
-    repositories = []
+    # Get repositories, read lazily from the file as they are submitted
+    repositories = iter([])
     if args.file:
         repositories = load_repositories_from_file(args.file)
     elif args.org and args.repo:
-        repositories = [f"{args.org}/{args.repo}"]
+        repositories = iter([f"{args.org}/{args.repo}"])
     
-    if not repositories:
+    # Peek at the first repository so an empty list is reported before any work starts
+    first_repo = next(repositories, None)
+    if first_repo is None:
         print("No valid repositories specified.")
         sys.exit(1)
+    repositories = chain([first_repo], repositories)
+    
+    # Each repository fetches all of its workflows at once, and each workflow can fan
+    # out over JOB_PAGE_WORKERS job pages, so grow the connection pool to match;
+    # connections beyond the pool size would be discarded instead of reused
+    pool_size = args.workers * len(WORKFLOWS) * (1 + JOB_PAGE_WORKERS)
+    if pool_size > HTTP_POOL_SIZE:
+        SESSION.mount("https://", create_https_adapter(pool_size))
+    
+    load_json_cache(WORKFLOW_ID_CACHE_FILE, WORKFLOW_ID_CACHE_TTL, "resolved_at", workflow_id_cache)
+    load_json_cache(ETAG_CACHE_FILE, ETAG_CACHE_TTL, "cached_at", etag_cache)
+    
+    # Process repositories concurrently, collecting results in input order
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {}
+        for repo in repositories:
+            print(f"Processing repository: {repo}")
+            futures[repo] = executor.submit(get_workflow_results, repo, headers)
+        
+        # Collect the summaries and write them in one go once every repository is done
+        output = []
+        for repo, future in futures.items():
+            try:
+                results = future.result()
+                all_results[repo] = results
+                output.append(format_results(repo, results))
+            except Exception as e:
+                output.append(f"Error processing repository {repo}: {str(e)}")
+    
+    sys.stdout.write("\n".join(output) + "\n")
+    sys.stdout.flush()
     
-    # Process each repository
-    for repo in repositories:
-        print(f"Processing repository: {repo}")
-        try:
-            results = get_workflow_results(repo, headers)
-            all_results[repo] = results
-            print(format_results(repo, results))
-        except Exception as e:
-            print(f"Error processing repository {repo}: {str(e)}")
+    save_json_cache(WORKFLOW_ID_CACHE_FILE, workflow_id_cache, "workflow ID cache")
+    save_json_cache(ETAG_CACHE_FILE, etag_cache, "API response cache")
     
     # Generate Excel report
-    excel_file = generate_excel_report(all_results, args.output)
-    print(f"Excel report saved to {excel_file}")
+    excel_file = generate_excel_report(all_results, args.output, args.engine, args.format)
+    print(f"Report saved to {excel_file}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
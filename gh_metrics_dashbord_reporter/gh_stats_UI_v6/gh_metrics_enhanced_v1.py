@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 import logging
 from datetime import datetime, timedelta
@@ -10,6 +11,77 @@ import argparse
 import sys
 import re
 import time
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+# ETag and parsed body per request, persisted between runs so unchanged resources
+# are answered with 304 Not Modified, which does not count against the rate limit
+ETAG_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "gh_metrics_etags.json")
+ETAG_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Request pacing kept inside GitHub's secondary rate limits
+# (900 REST points per minute, 30 search requests per minute)
+API_REQUESTS_PER_SECOND = 15
+API_BURST = 100
+SEARCH_REQUESTS_PER_SECOND = 0.5
+SEARCH_BURST = 30
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace API requests.
+    """
+    
+    def __init__(self, capacity, refill_rate):
+        """
+        Args:
+            capacity (int): Maximum number of tokens, i.e. the allowed burst
+            refill_rate (float): Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost=1):
+        """
+        Take tokens from the bucket, sleeping until enough have been refilled.
+        
+        Args:
+            cost (int): Number of tokens to take
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                
+                if self.tokens >= cost:
+                    self.tokens -= cost
+                    return
+                
+                wait = (cost - self.tokens) / self.refill_rate
+            
+            # Sleep outside the lock so other threads can refill and check the bucket
+            time.sleep(wait)
+
+class RateLimitedSession(requests.Session):
+    """
+    Session that takes a token from a rate limiter before every request.
+    Search endpoints have a much lower limit and use their own bucket.
+    """
+    
+    def __init__(self, rate_limiter, search_rate_limiter):
+        super().__init__()
+        self.rate_limiter = rate_limiter
+        self.search_rate_limiter = search_rate_limiter
+    
+    def request(self, method, url, *args, **kwargs):
+        limiter = self.search_rate_limiter if '/search/' in url else self.rate_limiter
+        limiter.acquire()
+        return super().request(method, url, *args, **kwargs)
 
 class GitHubMetricsReporter:
     """
@@ -17,6 +89,11 @@ class GitHubMetricsReporter:
     with enhanced health indicators, check status tracking, and version type analysis.
     """
     
+    # 'feat:', 'feat(', 'feat ', 'fix:', 'fix(' or 'fix ' prefix, optionally 'feat!' for breaking changes
+    FEAT_FIX_PATTERN = re.compile(r'(?:feat!?|fix)[:( ]', re.IGNORECASE)
+    # 'feat!' within the first six characters of the title
+    BREAKING_CHANGE_PATTERN = re.compile(r'.?feat!', re.IGNORECASE | re.DOTALL)
+    
     def __init__(self):
         """Initialize reporter with configuration and logging setup."""
         self.base_url = 'https://api.github.com'
@@ -27,6 +104,19 @@ class GitHubMetricsReporter:
         self.pr_threshold_days = 7
         # Maximum labels threshold
         self.max_labels_threshold = 2
+        # Number of PRs processed concurrently
+        self.max_workers = 8
+        # Number of concurrent API calls issued for a single PR
+        self.pr_request_workers = 4
+        # Pace API calls instead of running into GitHub's secondary rate limit
+        self.rate_limiter = TokenBucket(API_BURST, API_REQUESTS_PER_SECOND)
+        self.search_rate_limiter = TokenBucket(SEARCH_BURST, SEARCH_REQUESTS_PER_SECOND)
+        # Shared session so concurrent API calls reuse keep-alive connections
+        self.session = RateLimitedSession(self.rate_limiter, self.search_rate_limiter)
+        self.mount_connection_pool()
+        # Conditional request cache, see load_etag_cache
+        self.etag_cache_file = ETAG_CACHE_FILE
+        self.etag_cache = {}
         self._setup_logging()
         self.logger.info("GitHub Metrics Reporter initialized")
 
@@ -58,6 +148,16 @@ class GitHubMetricsReporter:
         self.logger.addHandler(file_handler)
         self.logger.addHandler(console_handler)
 
+    def mount_connection_pool(self):
+        """
+        Size the session's connection pool to the number of concurrent API calls.
+        Each PR worker paginates commits on its own thread while its per-PR pool runs
+        up to pr_request_workers more requests; connections beyond the pool size
+        would be discarded instead of reused. Call again after changing max_workers.
+        """
+        pool_size = self.max_workers * (self.pr_request_workers + 1)
+        self.session.mount('https://', HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
     def get_token(self, token_file=None):
         """
         Get GitHub token with flexible sourcing options.
@@ -102,7 +202,7 @@ class GitHubMetricsReporter:
             }
             
             # Verify token works
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/user',
                 headers=headers,
                 timeout=10
@@ -112,7 +212,7 @@ class GitHubMetricsReporter:
                 self.logger.info("GitHub authentication successful")
                 
                 # Check rate limits
-                rate_response = requests.get(
+                rate_response = self.session.get(
                     f'{self.base_url}/rate_limit',
                     headers=headers
                 )
@@ -130,6 +230,62 @@ class GitHubMetricsReporter:
             self.logger.error(f"Authentication error: {str(e)}")
             return None
 
+    def _cached_get(self, url, headers, params=None):
+        """
+        GET a JSON endpoint using a conditional request when a cached ETag is available.
+        
+        Args:
+            url (str): API URL
+            headers (dict): API headers
+            params (dict): Query parameters
+            
+        Returns:
+            tuple: Response and parsed body, or None as the body if the request failed
+        """
+        cache_key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        cached = self.etag_cache.get(cache_key)
+        if cached:
+            headers = {**headers, 'If-None-Match': cached['etag']}
+        
+        response = self.session.get(url, headers=headers, params=params)
+        
+        # Not modified responses have no body and do not count against the rate limit
+        if response.status_code == 304 and cached:
+            cached['cached_at'] = time.time()
+            return response, cached['data']
+        if response.status_code != 200:
+            return response, None
+        
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            self.etag_cache[cache_key] = {'etag': etag, 'data': data, 'cached_at': time.time()}
+        return response, data
+    
+    def load_etag_cache(self):
+        """Load cached API responses that have not expired."""
+        try:
+            with open(self.etag_cache_file, 'r', encoding='utf-8') as f:
+                cached_entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        now = time.time()
+        for cache_key, entry in cached_entries.items():
+            if now - entry.get('cached_at', 0) < ETAG_CACHE_TTL:
+                self.etag_cache[cache_key] = entry
+    
+    def save_etag_cache(self):
+        """Persist cached API responses for later runs."""
+        if not self.etag_cache:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.etag_cache_file), exist_ok=True)
+            with open(self.etag_cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.etag_cache, f)
+        except OSError as e:
+            self.logger.warning(f"Unable to save API response cache: {str(e)}")
+
     def fetch_repositories(self, headers, org_name):
         """
         Fetch all repositories for an organization.
@@ -141,9 +297,9 @@ class GitHubMetricsReporter:
             page = 1
             
             while True:
-                response = requests.get(
+                response, repos = self._cached_get(
                     f'{self.base_url}/orgs/{org_name}/repos',
-                    headers=headers,
+                    headers,
                     params={
                         'per_page': 100,
                         'page': page,
@@ -151,11 +307,10 @@ class GitHubMetricsReporter:
                     }
                 )
                 
-                if response.status_code != 200:
+                if repos is None:
                     self.logger.error(f"Failed to fetch repositories: {response.status_code}")
                     break
                     
-                repos = response.json()
                 if not repos:
                     break
                     
@@ -177,13 +332,13 @@ class GitHubMetricsReporter:
         Includes the target branch and other metadata.
         """
         try:
-            response = requests.get(
+            response, pr_details = self._cached_get(
                 f'{self.base_url}/repos/{repo}/pulls/{pr_number}',
-                headers=headers
+                headers
             )
             
-            if response.status_code == 200:
-                return response.json()
+            if pr_details is not None:
+                return pr_details
             else:
                 self.logger.error(f"Failed to fetch PR details for {repo}#{pr_number}: {response.status_code}")
                 return {}
@@ -197,7 +352,7 @@ class GitHubMetricsReporter:
         Fetch user information including organization membership.
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 f'{self.base_url}/users/{username}',
                 headers=headers
             )
@@ -217,14 +372,14 @@ class GitHubMetricsReporter:
         Check if a user is a member of an organization and get their team memberships.
         """
         try:
-            membership_response = requests.get(
+            membership_response = self.session.get(
                 f'{self.base_url}/orgs/{org}/memberships/{username}',
                 headers=headers
             )
             
             if membership_response.status_code == 200:
                 # Get teams
-                teams_response = requests.get(
+                teams_response = self.session.get(
                     f'{self.base_url}/orgs/{org}/teams',
                     headers=headers
                 )
@@ -234,7 +389,7 @@ class GitHubMetricsReporter:
                     user_teams = []
                     
                     for team in teams:
-                        team_membership_response = requests.get(
+                        team_membership_response = self.session.get(
                             f'{self.base_url}/teams/{team["id"]}/memberships/{username}',
                             headers=headers
                         )
@@ -261,16 +416,16 @@ class GitHubMetricsReporter:
         try:
             self.logger.debug(f"Fetching check runs for {repo} commit {commit_sha}")
             
-            response = requests.get(
+            response, data = self._cached_get(
                 f'{self.base_url}/repos/{repo}/commits/{commit_sha}/check-runs',
-                headers=headers
+                headers
             )
             
-            if response.status_code != 200:
+            if data is None:
                 self.logger.error(f"Failed to fetch check runs: {response.status_code}")
                 return {'total': 0, 'passed': 0, 'failed': 0}
             
-            checks = response.json().get('check_runs', [])
+            checks = data.get('check_runs', [])
             
             total_checks = len(checks)
             passed_checks = sum(1 for check in checks if check.get('conclusion') == 'success')
@@ -293,34 +448,25 @@ class GitHubMetricsReporter:
         try:
             files = []
             page = 1
-            total_additions = 0
-            total_deletions = 0
             
             while True:
-                response = requests.get(
+                response, page_files = self._cached_get(
                     f'{self.base_url}/repos/{repo}/pulls/{pr_number}/files',
-                    headers=headers,
+                    headers,
                     params={
                         'per_page': 100,
                         'page': page
                     }
                 )
                 
-                if response.status_code != 200:
+                if page_files is None:
                     self.logger.error(f"Failed to fetch PR files for {repo}#{pr_number}: {response.status_code}")
                     break
                     
-                page_files = response.json()
                 if not page_files:
                     break
                     
                 files.extend(page_files)
-                
-                # Sum up additions and deletions
-                for file in page_files:
-                    total_additions += file.get('additions', 0)
-                    total_deletions += file.get('deletions', 0)
-                
                 page += 1
             
             file_names = [file.get('filename', '') for file in files]
@@ -328,8 +474,8 @@ class GitHubMetricsReporter:
             return {
                 'file_list': file_names,
                 'file_count': len(file_names),
-                'additions': total_additions,
-                'deletions': total_deletions
+                'additions': sum(file.get('additions', 0) for file in files),
+                'deletions': sum(file.get('deletions', 0) for file in files)
             }
             
         except Exception as e:
@@ -341,6 +487,92 @@ class GitHubMetricsReporter:
                 'deletions': 0
             }
 
+    def get_pr_bundles(self, headers, repo, pr_numbers, batch_size=20):
+        """
+        Fetch the target branch and changed files for several PRs through the GraphQL API.
+        PRs are queried in batches using aliases, so a page of PRs costs a few requests
+        instead of separate details and files calls for every PR.
+        
+        Args:
+            headers (dict): API headers
+            repo (str): Repository name (org/repo)
+            pr_numbers (list): PR numbers to fetch
+            batch_size (int): Number of PRs requested per query
+        
+        Returns:
+            dict: PR number -> {'target_branch', 'file_data'}, where file_data matches get_pr_files.
+                  PRs that could not be fetched are left out so callers can fall back to REST.
+        """
+        owner, name = repo.split('/', 1)
+        bundles = {}
+        # PRs still to fetch, mapped to the cursor of their next page of files
+        pending = {pr_number: None for pr_number in pr_numbers}
+        
+        while pending:
+            batch = list(pending.items())[:batch_size]
+            
+            pr_queries = []
+            for i, (pr_number, cursor) in enumerate(batch):
+                after = f', after: {json.dumps(cursor)}' if cursor else ''
+                pr_queries.append(
+                    f'pr{i}: pullRequest(number: {pr_number}) {{ baseRefName additions deletions '
+                    f'files(first: 100{after}) {{ nodes {{ path }} pageInfo {{ hasNextPage endCursor }} }} }}'
+                )
+            query = (
+                'query($owner: String!, $name: String!) { repository(owner: $owner, name: $name) { '
+                + ' '.join(pr_queries) + ' } }'
+            )
+            
+            try:
+                response = self.session.post(
+                    f'{self.base_url}/graphql',
+                    headers=headers,
+                    json={'query': query, 'variables': {'owner': owner, 'name': name}},
+                    timeout=30
+                )
+                if response.status_code != 200:
+                    self.logger.error(f"Failed to fetch PR bundles for {repo}: {response.status_code}")
+                    break
+                
+                result = response.json()
+                repository = (result.get('data') or {}).get('repository') or {}
+                if result.get('errors'):
+                    self.logger.warning(f"GraphQL errors fetching PR bundles for {repo}: {result['errors'][0].get('message', '')}")
+            except Exception as e:
+                self.logger.error(f"Error fetching PR bundles for {repo}: {str(e)}")
+                break
+            
+            for i, (pr_number, cursor) in enumerate(batch):
+                del pending[pr_number]
+                pr_node = repository.get(f'pr{i}')
+                if not pr_node:
+                    # Drop partially fetched PRs so they are fetched again through REST
+                    bundles.pop(pr_number, None)
+                    continue
+                
+                bundle = bundles.setdefault(pr_number, {
+                    'target_branch': pr_node.get('baseRefName', ''),
+                    'file_data': {
+                        'file_list': [],
+                        'file_count': 0,
+                        'additions': pr_node.get('additions', 0),
+                        'deletions': pr_node.get('deletions', 0)
+                    }
+                })
+                files = pr_node.get('files') or {}
+                bundle['file_data']['file_list'].extend(file.get('path', '') for file in files.get('nodes', []))
+                bundle['file_data']['file_count'] = len(bundle['file_data']['file_list'])
+                
+                page_info = files.get('pageInfo', {})
+                if page_info.get('hasNextPage'):
+                    pending[pr_number] = page_info.get('endCursor')
+        
+        # Anything left pending when a request failed is incomplete, so leave it to REST
+        for pr_number in pending:
+            bundles.pop(pr_number, None)
+        
+        return bundles
+
     def is_feat_or_fix_pr(self, pr_title):
         """
         Check if a PR title starts with 'feat:', 'feat!:', 'fix:' or contains these as prefixes.
@@ -354,24 +586,8 @@ class GitHubMetricsReporter:
         """
         if not pr_title:
             return (False, False)
-            
-        # Normalize the title by converting to lowercase
-        title_lower = pr_title.lower()
-        
-        # Check for breaking change pattern
-        is_breaking_change = 'feat!' in title_lower[:6]  # Check only at the beginning
         
-        # Check for common prefix patterns
-        prefixes = ['feat:', 'feat(', 'fix:', 'fix(', 'feat!:', 'feat!(']
-        for prefix in prefixes:
-            if title_lower.startswith(prefix):
-                return (True, is_breaking_change)
-        
-        # Check for standalone words at the beginning
-        if title_lower.startswith('feat ') or title_lower.startswith('fix ') or title_lower.startswith('feat! '):
-            return (True, is_breaking_change)
-            
-        return (False, is_breaking_change)
+        return (bool(self.FEAT_FIX_PATTERN.match(pr_title)), bool(self.BREAKING_CHANGE_PATTERN.match(pr_title)))
 
     def check_folder_in_files(self, file_list, folder_name):
         """
@@ -459,370 +675,83 @@ class GitHubMetricsReporter:
             # Extract org name from repo full name (org/repo)
             org_name = repo.split('/')[0]
             
-            # Fetch PRs with pagination
-            page = 1
-            while True:
-                response = requests.get(
-                    f'{self.base_url}/repos/{repo}/pulls',
-                    headers=headers,
-                    params={
-                        'state': 'all',
-                        'sort': 'created',
-                        'direction': 'desc',
-                        'per_page': 100,
-                        'page': page
-                    }
-                )
-                
-                if response.status_code != 200:
-                    self.logger.error(f"Failed to fetch PRs: {response.status_code}")
-                    break
-                
-                prs = response.json()
-                if not prs:
-                    break
-                
-                # Process each PR
-                for pr in prs:
-                    try:
-                        created_at = datetime.strptime(pr['created_at'], '%Y-%m-%dT%H:%M:%SZ')
-                        created_at = self.utc.localize(created_at)
-                        
-                        if start_date <= created_at <= end_date:
-                            # Get detailed PR information including target branch
-                            pr_details = self.get_pr_details(headers, repo, pr['number'])
-                            target_branch = pr_details.get('base', {}).get('ref', '') if pr_details else ''
-                            
-                            # Get files changed in the PR
-                            file_data = self.get_pr_files(headers, repo, pr['number'])
-                            
-                            # Update repository statistics
-                            metrics['stats']['total_additions'] += file_data['additions']
-                            metrics['stats']['total_deletions'] += file_data['deletions']
-                            
-                            # Calculate PR duration
-                            pr_duration_days = 0
-                            if pr['state'] == 'closed' and pr['closed_at']:
-                                closed_at = datetime.strptime(pr['closed_at'], '%Y-%m-%dT%H:%M:%SZ')
-                                closed_at = self.utc.localize(closed_at)
-                                pr_duration_days = (closed_at - created_at).days
-                            else:
-                                # For open PRs, calculate days open so far
-                                pr_duration_days = (datetime.now(self.utc) - created_at).days
-                            
-                            # Extract PR labels
-                            labels = [label['name'] for label in pr.get('labels', [])]
-                            label_count = len(labels)
-                            
-                            # Determine PR health based on duration and label count
-                            pr_health = 'Healthy'
-                            health_reasons = []
-                            
-                            if pr_duration_days > self.pr_threshold_days:
-                                pr_health = 'Needs Attention'
-                                metrics['stats']['unhealthy_due_to_duration'] += 1
-                                health_reasons.append(f"PR open > {self.pr_threshold_days} days")
-                            
-                            if label_count > self.max_labels_threshold:
-                                pr_health = 'Needs Attention'
-                                metrics['stats']['unhealthy_due_to_labels'] += 1
-                                health_reasons.append(f"PR has > {self.max_labels_threshold} labels")
-                            
-                            if pr_health == 'Needs Attention':
-                                metrics['stats']['unhealthy_prs'] += 1
-                            else:
-                                metrics['stats']['healthy_prs'] += 1
-                            
-                            # Analyze version types based on labels
-                            version_analysis = self.analyze_version_labels(labels)
-                            
-                            # Update version statistics
-                            metrics['stats']['total_rc_versions'] += version_analysis['rc_versions']
-                            metrics['stats']['total_npd_versions'] += version_analysis['npd_versions']
-                            metrics['stats']['total_stable_versions'] += version_analysis['stable_versions']
-                            
-                            # Fetch PR reviews
-                            reviews_response = requests.get(
-                                f"{self.base_url}/repos/{repo}/pulls/{pr['number']}/reviews",
-                                headers=headers
-                            )
-                            reviews = reviews_response.json() if reviews_response.status_code == 200 else []
-                            
-                            # Find approvers and their comments
-                            approvers = []
-                            approver_comments = []
-                            approvals_with_comments = 0
-                            approvals_without_comments = 0
-                            
-                            # Track change requests
-                            change_requests = []
-                            change_request_count = 0
-                            change_request_status = "No changes requested"
-                            
-                            for review in reviews:
-                                review_state = review.get('state', '').upper()
-                                reviewer = review.get('user', {}).get('login', '')
-                                
-                                # Process APPROVED reviews
-                                if review_state == 'APPROVED':
-                                    approvers.append(reviewer)
-                                    
-                                    # Check if approver provided comments
-                                    if review.get('body') and review.get('body').strip():
-                                        approver_comments.append(review.get('body').strip())
-                                        approvals_with_comments += 1
-                                    else:
-                                        approvals_without_comments += 1
-                                
-                                # Process CHANGES_REQUESTED reviews
-                                elif review_state == 'CHANGES_REQUESTED':
-                                    change_request_count += 1
-                                    change_requests.append({
-                                        'reviewer': reviewer,
-                                        'comment': review.get('body', ''),
-                                        'submitted_at': review.get('submitted_at', '')
-                                    })
-                            
-                            metrics['stats']['total_change_requests'] += change_request_count
-                            
-                            # Determine if change requests are resolved
-                            if change_request_count > 0:
-                                # Check if PR is merged or closed
-                                if pr['state'] == 'closed' and pr.get('merged_at'):
-                                    change_request_status = "All changes resolved"
-                                else:
-                                    change_request_status = "Changes pending"
-                            
-                            # Fetch PR comments
-                            comments_response = requests.get(
-                                f"{self.base_url}/repos/{repo}/issues/{pr['number']}/comments",
-                                headers=headers
-                            )
-                            comments = comments_response.json() if comments_response.status_code == 200 else []
-                            
-                            # Count reviewer comments and approver comments
-                            total_reviewer_comments = 0
-                            total_approver_comments = 0
-                            
-                            # Count approver comments from reviews
-                            for review in reviews:
-                                reviewer = review.get('user', {}).get('login', '')
-                                if reviewer in approvers:
-                                    if review.get('body') and review.get('body').strip():
-                                        total_approver_comments += 1
-                                else:
-                                    if review.get('body') and review.get('body').strip():
-                                        total_reviewer_comments += 1
-                            
-                            # Count comments from issue comments
-                            for comment in comments:
-                                commenter = comment.get('user', {}).get('login', '')
-                                if commenter in approvers:
-                                    total_approver_comments += 1
-                                else:
-                                    total_reviewer_comments += 1
-                            
-                            # Fetch PR review comments (line comments)
-                            review_comments_response = requests.get(
-                                f"{self.base_url}/repos/{repo}/pulls/{pr['number']}/comments",
-                                headers=headers
-                            )
-                            review_comments = review_comments_response.json() if review_comments_response.status_code == 200 else []
-                            
-                            # Count resolved and unresolved conversations
-                            total_resolved_conversations = 0
-                            total_unresolved_conversations = 0
-                            
-                            # A simple heuristic: a conversation is resolved if it has a reply from the PR author
-                            conversation_threads = {}
-                            
-                            for comment in review_comments:
-                                thread_id = comment.get('in_reply_to_id', comment.get('id'))
-                                if thread_id not in conversation_threads:
-                                    conversation_threads[thread_id] = {
-                                        'resolved': False,
-                                        'commenters': set()
-                                    }
-                                conversation_threads[thread_id]['commenters'].add(comment.get('user', {}).get('login', ''))
-                                
-                                # Count comment by role
-                                commenter = comment.get('user', {}).get('login', '')
-                                if commenter in approvers:
-                                    total_approver_comments += 1
-                                else:
-                                    total_reviewer_comments += 1
-                            
-                            # Check if the PR author responded to each thread
-                            author = pr['user']['login']
-                            for thread_id, thread in conversation_threads.items():
-                                if author in thread['commenters']:
-                                    total_resolved_conversations += 1
-                                else:
-                                    total_unresolved_conversations += 1
-                            
-                            # Fetch commits with pagination - IMPROVED IMPLEMENTATION
-                            commits = []
-                            page = 1
-                            has_more_commits = True
-                            max_retries = 3
-                            
-                            while has_more_commits:
-                                try:
-                                    # Make sure we explicitly set per_page to 100 (maximum allowed by GitHub API)
-                                    # and include proper pagination parameters
-                                    commits_url = pr['commits_url']
-                                    
-                                    # Add debugging to see exact URL and page count
-                                    self.logger.debug(f"Fetching PR commits page {page} from {commits_url} for PR #{pr['number']}")
-                                    
-                                    retry_count = 0
-                                    commits_response = None
-                                    
-                                    # Add retry logic for resilience
-                                    while retry_count < max_retries:
-                                        try:
-                                            commits_response = requests.get(
-                                                commits_url,
-                                                headers=headers,
-                                                params={
-                                                    'per_page': 100,  # Request maximum items per page
-                                                    'page': page
-                                                },
-                                                timeout=30  # Add a timeout for network reliability
-                                            )
-                                            break  # Break out of retry loop if successful
-                                        except requests.exceptions.RequestException as e:
-                                            retry_count += 1
-                                            if retry_count >= max_retries:
-                                                self.logger.error(f"Failed to fetch PR commits after {max_retries} retries: {str(e)}")
-                                                raise
-                                            self.logger.warning(f"Retry {retry_count}/{max_retries} for PR commits: {str(e)}")
-                                            time.sleep(2)  # Wait before retrying
-                                    
-                                    # Check response status
-                                    if commits_response.status_code != 200:
-                                        self.logger.error(f"Failed to fetch PR commits for {repo}#{pr['number']}: {commits_response.status_code}")
-                                        self.logger.error(f"Response: {commits_response.text[:200]}...")  # Log part of the response for debugging
-                                        break
-                                    
-                                    # Get commits from this page
-                                    page_commits = commits_response.json()
-                                    
-                                    # Check if we received any commits
-                                    if not page_commits:
-                                        self.logger.debug(f"No more commits found for PR #{pr['number']} after page {page-1}")
-                                        has_more_commits = False
-                                        break
-                                    
-                                    # Process this page's commits
-                                    commits.extend(page_commits)
-                                    self.logger.debug(f"Fetched {len(page_commits)} commits from page {page}, total commits so far: {len(commits)}")
-                                    
-                                    # Check if we should continue to the next page
-                                    # GitHub API includes a Link header that indicates if there are more pages
-                                    if 'Link' in commits_response.headers and 'rel="next"' in commits_response.headers['Link']:
-                                        page += 1
-                                    else:
-                                        # No more pages indicated by Link header
-                                        has_more_commits = False
-                                        
-                                except Exception as e:
-                                    self.logger.error(f"Error fetching commits for PR #{pr['number']}: {str(e)}")
-                                    break
-                            
-                            # After fetching all commits, log the total count for verification
-                            self.logger.info(f"Total commits found for PR #{pr['number']}: {len(commits)}")
-                            
-                            # Process commit data and check status
-                            commit_data = []
-                            total_passed_checks = 0
-                            total_failed_checks = 0
-                            
-                            for commit in commits:
-                                commit_info = commit.get('commit', {})
-                                author_info = commit_info.get('author', {})
-                                commit_sha = commit.get('sha', '')
-                                
-                                # Get check runs for this commit
-                                check_runs = self.get_check_runs(headers, repo, commit_sha)
-                                total_passed_checks += check_runs['passed']
-                                total_failed_checks += check_runs['failed']
-                                
-                                commit_data.append({
-                                    'sha': commit_sha,
-                                    'message': commit_info.get('message', ''),
-                                    'author': author_info.get('name', ''),
-                                    'date': author_info.get('date', ''),
-                                    'passed_checks': check_runs['passed'],
-                                    'failed_checks': check_runs['failed']
-                                })
-                            
-                            metrics['stats']['total_passed_checks'] += total_passed_checks
-                            metrics['stats']['total_failed_checks'] += total_failed_checks
-                            
-                            # Determine if this is a feat/fix PR and if it's a breaking change
-                            is_feat_fix, is_breaking_change = self.is_feat_or_fix_pr(pr['title'])
-
-                            # Check for examples, tests, and integration_tests folders in the changed files
-                            has_examples = self.check_folder_in_files(file_data['file_list'], 'examples') if is_feat_fix else False
-                            has_tests = self.check_folder_in_files(file_data['file_list'], 'tests') if is_feat_fix else False
-                            has_integration_tests = self.check_folder_in_files(file_data['file_list'], 'integration_tests') if is_feat_fix else False
-                            
-                            # Build enhanced PR record
-                            pr_data = {
-                                'number': pr['number'],
-                                'title': pr['title'],
-                                'author': pr['user']['login'],
-                                'state': pr['state'],
-                                'created_at': created_at,
-                                'merged_at': None,
-                                'target_branch': target_branch,
-                                'pr_duration_days': pr_duration_days,
-                                'approvers': approvers,
-                                'approver_comments': approver_comments,
-                                'approvals_with_comments': approvals_with_comments,
-                                'approvals_without_comments': approvals_without_comments,
-                                'pr_health': pr_health,
-                                'health_reasons': health_reasons,
-                                'change_request_count': change_request_count,  # Keep for backward compatibility
-                                'change_request_status': change_request_status,  # Keep for backward compatibility
-                                'total_reviewer_comments': total_reviewer_comments,
-                                'total_approver_comments': total_approver_comments,
-                                'total_resolved_conversations': total_resolved_conversations,
-                                'total_unresolved_conversations': total_unresolved_conversations,
-                                'labels': labels,
-                                'label_count': label_count,
-                                'rc_versions': version_analysis['rc_versions'],
-                                'npd_versions': version_analysis['npd_versions'],
-                                'stable_versions': version_analysis['stable_versions'],
-                                'commits': commit_data,
-                                'commit_count': len(commit_data),
-                                'file_count': file_data['file_count'],
-                                'file_list': file_data['file_list'],
-                                'additions': file_data['additions'],
-                                'deletions': file_data['deletions'],
-                                'passed_checks': total_passed_checks,
-                                'failed_checks': total_failed_checks,
-                                'is_feat_fix_pr': is_feat_fix,
-                                'is_breaking_change': is_breaking_change,
-                                'has_examples': has_examples,
-                                'has_tests': has_tests,
-                                'has_integration_tests': has_integration_tests
-                            }
-                            
-                            # Process merge info
-                            if pr['merged_at']:
-                                merged_at = datetime.strptime(pr['merged_at'], '%Y-%m-%dT%H:%M:%SZ')
-                                pr_data['merged_at'] = self.utc.localize(merged_at)
-                                metrics['stats']['merged_prs'] += 1
-                            
-                            metrics['pull_requests'].append(pr_data)
-                            metrics['stats']['total_prs'] += 1
+            # Fetch PRs with pagination, processing each page's PRs on a shared worker pool
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                page = 1
+                while True:
+                    response = self.session.get(
+                        f'{self.base_url}/repos/{repo}/pulls',
+                        headers=headers,
+                        params={
+                            'state': 'all',
+                            'sort': 'created',
+                            'direction': 'desc',
+                            'per_page': 100,
+                            'page': page
+                        }
+                    )
+                    
+                    if response.status_code != 200:
+                        self.logger.error(f"Failed to fetch PRs: {response.status_code}")
+                        break
+                    
+                    prs = response.json()
+                    if not prs:
+                        break
+                    
+                    # Only PRs created in the date range are processed
+                    page_prs = []
+                    for pr in prs:
+                        try:
+                            created_at = datetime.strptime(pr['created_at'], '%Y-%m-%dT%H:%M:%SZ')
+                            created_at = self.utc.localize(created_at)
                             
-                    except Exception as e:
-                        self.logger.error(f"Error processing PR #{pr.get('number', 'unknown')}: {str(e)}")
-                
-                page += 1
+                            if start_date <= created_at <= end_date:
+                                page_prs.append((pr, created_at))
+                        except Exception as e:
+                            self.logger.error(f"Error processing PR #{pr.get('number', 'unknown')}: {str(e)}")
+                    
+                    # Fetch target branches and changed files for this page's PRs in batched GraphQL queries
+                    page_pr_numbers = [pr['number'] for pr, created_at in page_prs]
+                    pr_bundles = self.get_pr_bundles(headers, repo, page_pr_numbers) if page_pr_numbers else {}
+                    
+                    # Process the PRs concurrently, then add them up in page order on this thread
+                    futures = [
+                        (pr, executor.submit(self._process_single_pr, headers, repo, pr, created_at, pr_bundles.get(pr['number'])))
+                        for pr, created_at in page_prs
+                    ]
+                    
+                    for pr, future in futures:
+                        try:
+                            pr_data = future.result()
+                        except Exception as e:
+                            self.logger.error(f"Error processing PR #{pr.get('number', 'unknown')}: {str(e)}")
+                            continue
+                        
+                        stats = metrics['stats']
+                        stats['total_additions'] += pr_data['additions']
+                        stats['total_deletions'] += pr_data['deletions']
+                        if pr_data['pr_duration_days'] > self.pr_threshold_days:
+                            stats['unhealthy_due_to_duration'] += 1
+                        if pr_data['label_count'] > self.max_labels_threshold:
+                            stats['unhealthy_due_to_labels'] += 1
+                        if pr_data['pr_health'] == 'Needs Attention':
+                            stats['unhealthy_prs'] += 1
+                        else:
+                            stats['healthy_prs'] += 1
+                        stats['total_rc_versions'] += pr_data['rc_versions']
+                        stats['total_npd_versions'] += pr_data['npd_versions']
+                        stats['total_stable_versions'] += pr_data['stable_versions']
+                        stats['total_change_requests'] += pr_data['change_request_count']
+                        stats['total_passed_checks'] += pr_data['passed_checks']
+                        stats['total_failed_checks'] += pr_data['failed_checks']
+                        if pr_data['merged_at']:
+                            stats['merged_prs'] += 1
+                        
+                        metrics['pull_requests'].append(pr_data)
+                        stats['total_prs'] += 1
+                    
+                    page += 1
             
             return metrics
             
@@ -830,6 +759,366 @@ class GitHubMetricsReporter:
             self.logger.error(f"Error fetching PR data for {repo}: {str(e)}")
             return None
 
+    def _process_single_pr(self, headers, repo, pr, created_at, pr_bundle=None):
+        """
+        Build the enhanced record for a single PR.
+        Runs on a worker thread, so it only reads shared state; repository statistics
+        are added up from the returned record by fetch_pr_data.
+        
+        Args:
+            headers (dict): API headers
+            repo (str): Repository name (org/repo)
+            pr (dict): PR as returned by the pulls list endpoint
+            created_at (datetime): PR creation time in UTC
+            pr_bundle (dict): Target branch and file data from get_pr_bundles, if available
+            
+        Returns:
+            dict: PR record
+        """
+        if pr_bundle:
+            target_branch = pr_bundle['target_branch']
+            file_data = pr_bundle['file_data']
+        else:
+            # Fall back to REST when the GraphQL bundle is unavailable
+            pr_details = self.get_pr_details(headers, repo, pr['number'])
+            target_branch = pr_details.get('base', {}).get('ref', '') if pr_details else ''
+            file_data = self.get_pr_files(headers, repo, pr['number'])
+        
+        # Calculate PR duration
+        pr_duration_days = 0
+        if pr['state'] == 'closed' and pr['closed_at']:
+            closed_at = datetime.strptime(pr['closed_at'], '%Y-%m-%dT%H:%M:%SZ')
+            closed_at = self.utc.localize(closed_at)
+            pr_duration_days = (closed_at - created_at).days
+        else:
+            # For open PRs, calculate days open so far
+            pr_duration_days = (datetime.now(self.utc) - created_at).days
+        
+        # Extract PR labels
+        labels = [label['name'] for label in pr.get('labels', [])]
+        label_count = len(labels)
+        
+        # Determine PR health based on duration and label count
+        pr_health = 'Healthy'
+        health_reasons = []
+        
+        if pr_duration_days > self.pr_threshold_days:
+            pr_health = 'Needs Attention'
+            health_reasons.append(f"PR open > {self.pr_threshold_days} days")
+        
+        if label_count > self.max_labels_threshold:
+            pr_health = 'Needs Attention'
+            health_reasons.append(f"PR has > {self.max_labels_threshold} labels")
+        
+        # Analyze version types based on labels
+        version_analysis = self.analyze_version_labels(labels)
+        
+        with ThreadPoolExecutor(max_workers=self.pr_request_workers) as executor:
+            # Reviews, issue comments, review comments and commits don't depend on each other,
+            # so issue them together instead of one round trip after another
+            reviews_future = executor.submit(
+                self._get_json_list, headers, f"{self.base_url}/repos/{repo}/pulls/{pr['number']}/reviews"
+            )
+            comments_future = executor.submit(
+                self._get_json_list, headers, f"{self.base_url}/repos/{repo}/issues/{pr['number']}/comments"
+            )
+            review_comments_future = executor.submit(
+                self._get_json_list, headers, f"{self.base_url}/repos/{repo}/pulls/{pr['number']}/comments"
+            )
+            commits = self._get_pr_commits(headers, repo, pr)
+            
+            # Get check runs for every commit
+            commit_shas = [commit.get('sha', '') for commit in commits]
+            commit_check_runs = list(executor.map(
+                lambda commit_sha: self.get_check_runs(headers, repo, commit_sha), commit_shas
+            ))
+            
+            reviews = reviews_future.result()
+            comments = comments_future.result()
+            review_comments = review_comments_future.result()
+        
+        # Find approvers and their comments
+        approvers = []
+        approver_comments = []
+        approvals_with_comments = 0
+        approvals_without_comments = 0
+        
+        # Track change requests
+        change_requests = []
+        change_request_count = 0
+        change_request_status = "No changes requested"
+        
+        # Reviews with a comment per reviewer; whether they count as approver or reviewer
+        # comments depends on the full set of approvers, which is only known after the loop
+        review_comment_counts = {}
+        
+        for review in reviews:
+            review_state = review.get('state', '').upper()
+            reviewer = review.get('user', {}).get('login', '')
+            body = (review.get('body') or '').strip()
+            
+            if body:
+                review_comment_counts[reviewer] = review_comment_counts.get(reviewer, 0) + 1
+            
+            # Process APPROVED reviews
+            if review_state == 'APPROVED':
+                approvers.append(reviewer)
+                
+                # Check if approver provided comments
+                if body:
+                    approver_comments.append(body)
+                    approvals_with_comments += 1
+                else:
+                    approvals_without_comments += 1
+            
+            # Process CHANGES_REQUESTED reviews
+            elif review_state == 'CHANGES_REQUESTED':
+                change_request_count += 1
+                change_requests.append({
+                    'reviewer': reviewer,
+                    'comment': review.get('body', ''),
+                    'submitted_at': review.get('submitted_at', '')
+                })
+        
+        # Determine if change requests are resolved
+        if change_request_count > 0:
+            # Check if PR is merged or closed
+            if pr['state'] == 'closed' and pr.get('merged_at'):
+                change_request_status = "All changes resolved"
+            else:
+                change_request_status = "Changes pending"
+        
+        # Count reviewer comments and approver comments
+        approver_set = set(approvers)
+        total_reviewer_comments = 0
+        total_approver_comments = 0
+        
+        # Count approver comments from reviews
+        for reviewer, count in review_comment_counts.items():
+            if reviewer in approver_set:
+                total_approver_comments += count
+            else:
+                total_reviewer_comments += count
+        
+        # Count comments from issue comments
+        for comment in comments:
+            commenter = comment.get('user', {}).get('login', '')
+            if commenter in approver_set:
+                total_approver_comments += 1
+            else:
+                total_reviewer_comments += 1
+        
+        # Count resolved and unresolved conversations
+        total_resolved_conversations = 0
+        total_unresolved_conversations = 0
+        
+        # A simple heuristic: a conversation is resolved if it has a reply from the PR author
+        conversation_threads = {}
+        
+        for comment in review_comments:
+            thread_id = comment.get('in_reply_to_id', comment.get('id'))
+            if thread_id not in conversation_threads:
+                conversation_threads[thread_id] = {
+                    'resolved': False,
+                    'commenters': set()
+                }
+            commenter = comment.get('user', {}).get('login', '')
+            conversation_threads[thread_id]['commenters'].add(commenter)
+            
+            # Count comment by role
+            if commenter in approver_set:
+                total_approver_comments += 1
+            else:
+                total_reviewer_comments += 1
+        
+        # Check if the PR author responded to each thread
+        author = pr['user']['login']
+        for thread_id, thread in conversation_threads.items():
+            if author in thread['commenters']:
+                total_resolved_conversations += 1
+            else:
+                total_unresolved_conversations += 1
+        
+        # Process commit data and check status
+        commit_data = []
+        total_passed_checks = 0
+        total_failed_checks = 0
+        
+        for commit, check_runs in zip(commits, commit_check_runs):
+            commit_info = commit.get('commit', {})
+            author_info = commit_info.get('author', {})
+            commit_sha = commit.get('sha', '')
+            
+            total_passed_checks += check_runs['passed']
+            total_failed_checks += check_runs['failed']
+            
+            commit_data.append({
+                'sha': commit_sha,
+                'message': commit_info.get('message', ''),
+                'author': author_info.get('name', ''),
+                'date': author_info.get('date', ''),
+                'passed_checks': check_runs['passed'],
+                'failed_checks': check_runs['failed']
+            })
+        
+        # Determine if this is a feat/fix PR and if it's a breaking change
+        is_feat_fix, is_breaking_change = self.is_feat_or_fix_pr(pr['title'])
+
+        # Check for examples, tests, and integration_tests folders in the changed files
+        has_examples = self.check_folder_in_files(file_data['file_list'], 'examples') if is_feat_fix else False
+        has_tests = self.check_folder_in_files(file_data['file_list'], 'tests') if is_feat_fix else False
+        has_integration_tests = self.check_folder_in_files(file_data['file_list'], 'integration_tests') if is_feat_fix else False
+        
+        # Build enhanced PR record
+        pr_data = {
+            'number': pr['number'],
+            'title': pr['title'],
+            'author': pr['user']['login'],
+            'state': pr['state'],
+            'created_at': created_at,
+            'merged_at': None,
+            'target_branch': target_branch,
+            'pr_duration_days': pr_duration_days,
+            'approvers': approvers,
+            'approver_comments': approver_comments,
+            'approvals_with_comments': approvals_with_comments,
+            'approvals_without_comments': approvals_without_comments,
+            'pr_health': pr_health,
+            'health_reasons': health_reasons,
+            'change_request_count': change_request_count,  # Keep for backward compatibility
+            'change_request_status': change_request_status,  # Keep for backward compatibility
+            'total_reviewer_comments': total_reviewer_comments,
+            'total_approver_comments': total_approver_comments,
+            'total_resolved_conversations': total_resolved_conversations,
+            'total_unresolved_conversations': total_unresolved_conversations,
+            'labels': labels,
+            'label_count': label_count,
+            'rc_versions': version_analysis['rc_versions'],
+            'npd_versions': version_analysis['npd_versions'],
+            'stable_versions': version_analysis['stable_versions'],
+            'commits': commit_data,
+            'commit_count': len(commit_data),
+            'file_count': file_data['file_count'],
+            'file_list': file_data['file_list'],
+            'additions': file_data['additions'],
+            'deletions': file_data['deletions'],
+            'passed_checks': total_passed_checks,
+            'failed_checks': total_failed_checks,
+            'is_feat_fix_pr': is_feat_fix,
+            'is_breaking_change': is_breaking_change,
+            'has_examples': has_examples,
+            'has_tests': has_tests,
+            'has_integration_tests': has_integration_tests
+        }
+        
+        # Process merge info
+        if pr['merged_at']:
+            merged_at = datetime.strptime(pr['merged_at'], '%Y-%m-%dT%H:%M:%SZ')
+            pr_data['merged_at'] = self.utc.localize(merged_at)
+        
+        return pr_data
+
+    def _get_json_list(self, headers, url):
+        """
+        Fetch a list endpoint, returning an empty list on failure.
+        
+        Args:
+            headers (dict): API headers
+            url (str): API URL
+            
+        Returns:
+            list: Decoded response, or an empty list if the request failed
+        """
+        response, data = self._cached_get(url, headers)
+        return data if data is not None else []
+    
+    def _get_pr_commits(self, headers, repo, pr):
+        """
+        Fetch all commits of a PR, following pagination.
+        
+        Args:
+            headers (dict): API headers
+            repo (str): Repository name (org/repo)
+            pr (dict): PR as returned by the pulls list endpoint
+            
+        Returns:
+            list: Commits of the PR
+        """
+        # Fetch commits with pagination
+        commits = []
+        page = 1
+        has_more_commits = True
+        max_retries = 3
+        
+        while has_more_commits:
+            try:
+                # Make sure we explicitly set per_page to 100 (maximum allowed by GitHub API)
+                # and include proper pagination parameters
+                commits_url = pr['commits_url']
+                
+                # Add debugging to see exact URL and page count
+                self.logger.debug(f"Fetching PR commits page {page} from {commits_url} for PR #{pr['number']}")
+                
+                retry_count = 0
+                commits_response = None
+                
+                # Add retry logic for resilience
+                while retry_count < max_retries:
+                    try:
+                        commits_response = self.session.get(
+                            commits_url,
+                            headers=headers,
+                            params={
+                                'per_page': 100,  # Request maximum items per page
+                                'page': page
+                            },
+                            timeout=30  # Add a timeout for network reliability
+                        )
+                        break  # Break out of retry loop if successful
+                    except requests.exceptions.RequestException as e:
+                        retry_count += 1
+                        if retry_count >= max_retries:
+                            self.logger.error(f"Failed to fetch PR commits after {max_retries} retries: {str(e)}")
+                            raise
+                        self.logger.warning(f"Retry {retry_count}/{max_retries} for PR commits: {str(e)}")
+                        time.sleep(2)  # Wait before retrying
+                
+                # Check response status
+                if commits_response.status_code != 200:
+                    self.logger.error(f"Failed to fetch PR commits for {repo}#{pr['number']}: {commits_response.status_code}")
+                    self.logger.error(f"Response: {commits_response.text[:200]}...")  # Log part of the response for debugging
+                    break
+                
+                # Get commits from this page
+                page_commits = commits_response.json()
+                
+                # Check if we received any commits
+                if not page_commits:
+                    self.logger.debug(f"No more commits found for PR #{pr['number']} after page {page-1}")
+                    has_more_commits = False
+                    break
+                
+                # Process this page's commits
+                commits.extend(page_commits)
+                self.logger.debug(f"Fetched {len(page_commits)} commits from page {page}, total commits so far: {len(commits)}")
+                
+                # Check if we should continue to the next page
+                # GitHub API includes a Link header that indicates if there are more pages
+                if 'Link' in commits_response.headers and 'rel="next"' in commits_response.headers['Link']:
+                    page += 1
+                else:
+                    # No more pages indicated by Link header
+                    has_more_commits = False
+                    
+            except Exception as e:
+                self.logger.error(f"Error fetching commits for PR #{pr['number']}: {str(e)}")
+                break
+        
+        # After fetching all commits, log the total count for verification
+        self.logger.info(f"Total commits found for PR #{pr['number']}: {len(commits)}")
+        
+        return commits
+
     def fetch_additional_contributor_commits(self, headers, repo, start_date, end_date):
         """
         Fetch all contributors who made commits between start_date and end_date,
@@ -866,7 +1155,7 @@ class GitHubMetricsReporter:
                 
                 while retry_count < max_retries:
                     try:
-                        response = requests.get(
+                        response = self.session.get(
                             f'{self.base_url}/repos/{repo}/commits',
                             headers=headers,
                             params={
@@ -1724,7 +2013,13 @@ def parse_arguments():
     parser.add_argument('--output-dir', help='Custom output directory path')
     parser.add_argument('--pr-threshold', type=int, default=7, help='PR health threshold in days (default: 7)')
     parser.add_argument('--label-threshold', type=int, default=2, help='Maximum labels threshold (default: 2)')
-    return parser.parse_args()
+    parser.add_argument('--workers', type=int, default=8, help='Number of PRs processed concurrently (default: 8)')
+    args = parser.parse_args()
+    
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
+    return args
 
 
 def main():
@@ -1747,6 +2042,11 @@ def main():
             reporter.max_labels_threshold = args.label_threshold
             reporter.logger.info(f"Label threshold set to {reporter.max_labels_threshold}")
         
+        # Set PR worker count from command line
+        reporter.max_workers = args.workers
+        reporter.mount_connection_pool()
+        reporter.logger.info(f"Processing up to {reporter.max_workers} PRs concurrently")
+        
         # Get and validate headers
         headers = reporter.validate_token(token_file=args.token_file)
         if not headers:
@@ -1789,6 +2089,8 @@ def main():
         output_dir = args.output_dir if args.output_dir else f'reports_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
         os.makedirs(output_dir, exist_ok=True)
         
+        reporter.load_etag_cache()
+        
         # Collect metrics
         all_metrics = {}
         # Track all repositories for reporting
@@ -1829,6 +2131,8 @@ def main():
             except Exception as e:
                 reporter.logger.error(f"Error processing {repo}: {str(e)}")
                 continue
+        
+        reporter.save_etag_cache()
                 
         # Generate reports
         if all_metrics: